@@ -0,0 +1,29 @@
+"""
+Approved skills document shared by the agents and the tailoring route.
+
+Agents are reused across requests, so the file is re-read whenever its
+mtime changes instead of once per agent instance.
+"""
+import os
+
+APPROVED_SKILLS_PATH = "agent_prompts/approved_skills.md"
+
+# (mtime_ns, contents) of the approved skills file as last read
+_approved_skills_cache: tuple[int, str] | None = None
+
+
+def read_approved_skills() -> str | None:
+    """Read the approved skills file, reusing the cached copy until it changes on disk.
+
+    Returns None if the file does not exist.
+    """
+    global _approved_skills_cache
+    try:
+        mtime_ns = os.stat(APPROVED_SKILLS_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _approved_skills_cache
+    if cached is None or cached[0] != mtime_ns:
+        with open(APPROVED_SKILLS_PATH, "r") as f:
+            cached = _approved_skills_cache = (mtime_ns, f.read())
+    return cached[1]
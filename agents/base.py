@@ -59,14 +59,14 @@ class BaseAgent(ABC):
             )
 
     @observe(as_type="generation")
-    def _call_llm(self, user_prompt: str) -> str:
+    def _call_llm(self, user_prompt: str, system_prompt: str | None = None) -> str:
         """Make a LLM call using OpenAI SDK and return the response text."""
         if not self.api_key:
             logger.critical("OPENROUTER_API_KEY not set in environment")
             raise ValueError("OPENROUTER_API_KEY not set in environment")
             
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            {"role": "system", "content": self.system_prompt if system_prompt is None else system_prompt},
             {"role": "user", "content": user_prompt},
         ]
         
@@ -221,10 +221,11 @@ class BaseAgent(ABC):
     @observe()
     def run(self, **kwargs) -> dict:
         """Execute the agent and return parsed results."""
-        self.system_prompt = self.get_system_prompt()
+        # Prompts are locals so one agent instance can serve concurrent callers
+        system_prompt = self.get_system_prompt()
         user_prompt = self.build_user_prompt(**kwargs)
         
-        response_text = self._call_llm(user_prompt)
+        response_text = self._call_llm(user_prompt, system_prompt=system_prompt)
         result = self._parse_json_response(response_text)
         
         # Add metadata
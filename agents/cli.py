@@ -11,6 +11,8 @@ Usage:
 import argparse
 import json
 import sys
+import time
+from functools import lru_cache
 
 import polars as pl
 from deltalake import DeltaTable
@@ -26,33 +28,42 @@ from .database import (
     get_db_connection,
 )
 from .job_evaluator import JobEvaluatorAgent
-from .jd_parser import JDParserAgent
+from .jd_parser import get_jd_parser_agent
 
 
-def get_storage_options() -> dict:
-    """Get S3 storage options for Delta Lake."""
-    return {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-    }
+# Seconds before the cached Gold table handle checks _delta_log for new versions
+GOLD_REFRESH_SECONDS = 30
 
+_gold_refreshed_at = 0.0
 
-def load_gold_jobs() -> pl.DataFrame:
-    """Load jobs from Gold Delta table."""
-    storage_options = get_storage_options()
+
+@lru_cache(maxsize=1)
+def _gold_table() -> DeltaTable:
+    """Get a cached handle to the Gold Delta table."""
+    global _gold_refreshed_at
     gold_path = f"s3://{settings.DELTA_LAKEHOUSE_BUCKET}/gold/jobs"
-    
-    dt = DeltaTable(gold_path, storage_options=storage_options)
-    return pl.from_arrow(dt.to_pyarrow_table())
+    dt = DeltaTable(gold_path, storage_options=settings.delta_storage_options())
+    _gold_refreshed_at = time.monotonic()
+    return dt
+
+
+def load_gold_jobs() -> pl.LazyFrame:
+    """Lazily scan jobs from Gold Delta table.
+    
+    Filters and column selections applied to the returned frame are pushed
+    down into the Delta scan, so only matching files are read on collect().
+    """
+    global _gold_refreshed_at
+    dt = _gold_table()
+    if time.monotonic() - _gold_refreshed_at > GOLD_REFRESH_SECONDS:
+        dt.update_incremental()
+        _gold_refreshed_at = time.monotonic()
+    return pl.scan_delta(dt)
 
 
 def get_job_by_id(job_id: str) -> dict | None:
     """Get a single job from Gold table by ID."""
-    df = load_gold_jobs()
-    job_df = df.filter(pl.col("id") == job_id)
+    job_df = load_gold_jobs().filter(pl.col("id") == job_id).collect()
     
     if job_df.is_empty():
         return None
@@ -143,7 +154,7 @@ def cmd_parse(args):
     print(f"📋 Parsing JD for: {job.get('title', 'Unknown')} @ {job.get('company_name', 'Unknown')}")
     
     # Run parser
-    agent = JDParserAgent()
+    agent = get_jd_parser_agent()
     
     try:
         result = agent.run(
@@ -176,14 +187,18 @@ def cmd_run(args):
     init_database()
     
     # Load all jobs
-    df = load_gold_jobs()
+    df = (
+        load_gold_jobs()
+        .select(pl.col("id").cast(pl.Utf8), "title", "company_name", "description_text", "link")
+        .collect()
+    )
     print(f"📊 Found {len(df)} jobs in Gold table")
     
     evaluated = 0
     parsed = 0
     skipped = 0
     
-    for row in df.iter_rows(named=True):
+    for row in df.to_dicts():
         if evaluated >= max_jobs:
             break
         
@@ -214,7 +229,7 @@ def cmd_run(args):
                 # Parse if not skip
                 if verdict != "skip" and not is_job_parsed(job_id):
                     print(f"   📋 Parsing JD...")
-                    parser = JDParserAgent()
+                    parser = get_jd_parser_agent()
                     parse_result = parser.run(
                         job_id=job_id,
                         description_text=row.get("description_text", ""),
@@ -255,7 +270,6 @@ def cmd_status(args):
     cursor.execute("SELECT COUNT(*) FROM jd_parsed")
     total_parsed = cursor.fetchone()[0]
     
-    conn.close()
     
     print(f"\n📊 Evaluation Status:")
     print(f"   Total evaluated: {total_evals}")
@@ -4,10 +4,15 @@ Database module for storing agent evaluation results.
 Supports both SQLite (local) and Supabase (cloud) backends.
 Toggle with USE_SUPABASE environment variable.
 """
+import atexit
 import json
 import sqlite3
 import logging
+import threading
+import weakref
+import orjson
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -53,20 +58,57 @@ def _execute_safe(query_builder):
 # SQLITE FUNCTIONS (Original)
 # ============================================
 
+@lru_cache(maxsize=1)
 def get_db_path() -> Path:
-    """Get the database path, creating parent directories if needed."""
+    """Get the database path, creating parent directories on first call."""
     db_path = Path(settings.EVAL_DB_PATH)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     return db_path
 
 
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection that can be weakly referenced (the base type cannot)."""
+
+
+_local = threading.local()
+# Weak so a connection is freed (and closed) once its thread exits and the
+# thread-local drops it; the atexit hook only sees connections still alive
+_connections: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+_connections_lock = threading.Lock()
+
+
 def get_db_connection() -> sqlite3.Connection:
-    """Get a SQLite database connection."""
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
+    """Get this thread's SQLite database connection, opening it on first use.
+    
+    The connection is reused for the lifetime of the thread, so callers must
+    not close it. A transaction left open by a failed caller is rolled back
+    before the connection is handed out again.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        # check_same_thread=False only so the atexit hook can close it
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False, factory=_PooledConnection)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # safe with WAL, fewer fsyncs
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        _local.conn = conn
+        with _connections_lock:
+            _connections.add(conn)
+    elif conn.in_transaction:
+        conn.rollback()
     return conn
 
 
+@atexit.register
+def _close_db_connections():
+    """Close every pooled SQLite connection at interpreter exit."""
+    with _connections_lock:
+        for conn in list(_connections):
+            conn.close()
+        _connections.clear()
+
+
 def init_database():
     """Initialize the SQLite database schema."""
     if _use_supabase():
@@ -153,13 +195,15 @@ def init_database():
     # Indexes
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_job_id ON resumes(job_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_status ON resumes(status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_job_version ON resumes(job_id, version DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_resumes_status_created ON resumes(status, created_at DESC)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_verdict ON job_evaluations(verdict)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_score ON job_evaluations(job_match_score)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_action ON job_evaluations(recommended_action)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_task_status ON tasks(status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_task_created_at ON tasks(created_at)")
     
     conn.commit()
-    conn.close()
     
     print(f"SQLite database initialized at: {get_db_path()}")
 
@@ -206,7 +250,34 @@ def is_job_evaluated(job_id: str) -> bool:
     cursor = conn.cursor()
     cursor.execute("SELECT 1 FROM job_evaluations WHERE job_id = ?", (job_id,))
     result = cursor.fetchone() is not None
-    conn.close()
+    return result
+
+
+_EVALUATION_JSON_FIELDS = (
+    "gaps",
+    "improvement_suggestions",
+    "interview_tips",
+    "jd_keywords",
+    "matched_keywords",
+    "missing_keywords",
+)
+
+
+def _decode_evaluation_row(row: sqlite3.Row) -> dict:
+    """Decode the JSON-encoded TEXT columns of a SQLite evaluation row.
+
+    Supabase stores these columns as JSONB and returns them already decoded,
+    so only the SQLite backend needs this.
+    """
+    result = dict(row)
+    loads = orjson.loads
+    for field in _EVALUATION_JSON_FIELDS:
+        value = result.get(field)
+        if value and isinstance(value, str):
+            try:
+                result[field] = loads(value)
+            except orjson.JSONDecodeError:
+                pass
     return result
 
 
@@ -223,8 +294,7 @@ def get_evaluation(job_id: str) -> dict | None:
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM job_evaluations WHERE job_id = ?", (job_id,))
     row = cursor.fetchone()
-    conn.close()
-    return dict(row) if row else None
+    return _decode_evaluation_row(row) if row else None
 
 
 def list_evaluations(skip: int = 0, limit: int = 20, action: str | None = None, verdict: str | None = None, search: str | None = None) -> tuple[list[dict], int]:
@@ -294,9 +364,8 @@ def list_evaluations(skip: int = 0, limit: int = 20, action: str | None = None,
     
     cursor.execute(query, params)
     rows = cursor.fetchall()
-    conn.close()
     
-    return [dict(row) for row in rows], total_count
+    return [_decode_evaluation_row(row) for row in rows], total_count
 
 
 def get_evaluation_statistics() -> dict:
@@ -361,7 +430,6 @@ def get_evaluation_statistics() -> dict:
     cursor.execute("SELECT verdict, COUNT(*) FROM job_evaluations GROUP BY verdict")
     by_verdict = dict(cursor.fetchall())
     
-    conn.close()
     
     return {
         "total_evaluated": total,
@@ -446,7 +514,6 @@ def save_evaluation(result: dict):
     ))
     
     conn.commit()
-    conn.close()
 
 
 # ============================================
@@ -464,7 +531,6 @@ def is_job_parsed(job_id: str) -> bool:
     cursor = conn.cursor()
     cursor.execute("SELECT 1 FROM jd_parsed WHERE job_id = ?", (job_id,))
     result = cursor.fetchone() is not None
-    conn.close()
     return result
 
 
@@ -524,13 +590,39 @@ def save_jd_parsed(result: dict):
     ))
     
     conn.commit()
-    conn.close()
 
 
 # ============================================
 # TASK FUNCTIONS
 # ============================================
 
+# Task status polls hit these on every tick; constant SQL text lets sqlite3
+# reuse its per-connection prepared statement cache
+LIST_TASKS_SQL = """
+    SELECT task_id, status, progress, error, created_at, completed_at
+    FROM tasks
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+GET_TASK_STATUS_SQL = """
+    SELECT task_id, status, progress, error, created_at, completed_at
+    FROM tasks
+    WHERE task_id = ?
+"""
+
+
+def _task_row_to_dict(row: sqlite3.Row) -> dict:
+    """Convert a tasks row to a dict, decoding the progress JSON."""
+    result = dict(row)
+    if result["progress"]:
+        try:
+            result["progress"] = orjson.loads(result["progress"])
+        except orjson.JSONDecodeError:
+            result["progress"] = None
+    return result
+
+
 def list_tasks(limit: int = 20) -> list[dict]:
     """List recent tasks."""
     if _use_supabase():
@@ -538,13 +630,8 @@ def list_tasks(limit: int = 20) -> list[dict]:
         result = client.table("tasks").select("*").order("created_at", desc=True).limit(limit).execute()
         return result.data
     
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM tasks ORDER BY created_at DESC LIMIT ?", (limit,))
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    rows = get_db_connection().execute(LIST_TASKS_SQL, (limit,)).fetchall()
+    return [_task_row_to_dict(row) for row in rows]
 
 def save_task_status(task_id: str, status: str, progress: dict | None = None, error: str | None = None):
     """Save or update task status."""
@@ -585,21 +672,20 @@ def save_task_status(task_id: str, status: str, progress: dict | None = None, er
                 UPDATE tasks 
                 SET status = ?, progress = ?, error = ?, completed_at = ?
                 WHERE task_id = ?
-            """, (status, json.dumps(progress) if progress else None, error, datetime.now(), task_id))
+            """, (status, orjson.dumps(progress).decode() if progress else None, error, datetime.now(), task_id))
         else:
             cursor.execute("""
                 UPDATE tasks 
                 SET status = ?, progress = ?, error = ?
                 WHERE task_id = ?
-            """, (status, json.dumps(progress) if progress else None, error, task_id))
+            """, (status, orjson.dumps(progress).decode() if progress else None, error, task_id))
     else:
         cursor.execute("""
             INSERT INTO tasks (task_id, status, progress, error)
             VALUES (?, ?, ?, ?)
-        """, (task_id, status, json.dumps(progress) if progress else None, error))
+        """, (task_id, status, orjson.dumps(progress).decode() if progress else None, error))
     
     conn.commit()
-    conn.close()
 
 
 def get_task_status(task_id: str) -> dict | None:
@@ -611,20 +697,10 @@ def get_task_status(task_id: str) -> dict | None:
             return result.data[0]
         return None
     
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,))
-    row = cursor.fetchone()
-    conn.close()
+    row = get_db_connection().execute(GET_TASK_STATUS_SQL, (task_id,)).fetchone()
     
     if row:
-        result = dict(row)
-        if result.get("progress"):
-            try:
-                result["progress"] = json.loads(result["progress"])
-            except:
-                pass
-        return result
+        return _task_row_to_dict(row)
     return None
 
 
@@ -689,7 +765,7 @@ def save_resume(content: dict, name: str = "Master Resume", is_master: bool = Fa
     """, (
         record_id,
         name,
-        json.dumps(content),
+        orjson.dumps(content).decode(),
         status,
         job_id,
         version,
@@ -697,7 +773,6 @@ def save_resume(content: dict, name: str = "Master Resume", is_master: bool = Fa
     ))
     
     conn.commit()
-    conn.close()
     return record_id
 
 
@@ -731,19 +806,45 @@ def get_master_resume() -> dict | None:
         row = cursor.fetchone()
     except Exception:
         # Tables might not be migrated in SQLite yet
-        conn.close()
         return None
 
-    conn.close()
     
     if row and row[0]:
         try:
-            return json.loads(row[0])
+            return orjson.loads(row[0])
         except:
             return None
     return None
 
 
+def get_master_resume_id() -> str | None:
+    """Get the record ID of the latest master resume.
+    
+    Every master save inserts a new row, so the ID changes whenever the
+    master resume does; callers can use it as a cheap version key.
+    """
+    if _use_supabase():
+        client = _get_supabase()
+        try:
+            result = client.table("resumes").select("id").eq("status", "master").order("created_at", desc=True).limit(1).execute()
+            if result.data:
+                return result.data[0]["id"]
+        except Exception:
+            pass
+        return None
+        
+    try:
+        row = get_db_connection().execute("""
+            SELECT id FROM resumes 
+            WHERE status = 'master'
+            ORDER BY created_at DESC 
+            LIMIT 1
+        """).fetchone()
+    except Exception:
+        return None
+    return row[0] if row else None
+
+
 # ============================================
 # TAILORED RESUME FUNCTIONS
 # ============================================
@@ -780,19 +881,43 @@ def get_tailored_resumes(job_id: str) -> list[dict]:
     except Exception:
         rows = []
         
-    conn.close()
     
     results = []
     for row in rows:
         d = dict(row)
         try:
-            d["content"] = json.loads(d["content"])
+            d["content"] = orjson.loads(d["content"])
         except:
             pass
         results.append(d)
     return results
 
 
+def get_next_tailored_version(job_id: str) -> int:
+    """Get the version number for the next tailored resume of a job."""
+    if _use_supabase():
+        client = _get_supabase()
+        # Skip NULL versions like SQLite's MAX() does (desc order puts NULLs first)
+        result = (
+            client.table("resumes")
+            .select("version")
+            .eq("job_id", job_id)
+            .not_.is_("version", "null")
+            .order("version", desc=True)
+            .limit(1)
+            .execute()
+        )
+        if result.data:
+            return result.data[0]["version"] + 1
+        return 1
+
+    # Errors propagate: guessing 1 here would silently duplicate versions
+    row = get_db_connection().execute(
+        "SELECT COALESCE(MAX(version), 0) + 1 FROM resumes WHERE job_id = ?", (job_id,)
+    ).fetchone()
+    return row[0]
+
+
 def update_tailored_resume_status(record_id: str, status: str):
     """Update status (approved/rejected)."""
     if _use_supabase():
@@ -807,7 +932,6 @@ def update_tailored_resume_status(record_id: str, status: str):
         conn.commit()
     except Exception:
         pass
-    conn.close()
 
 
 def get_jd_parsed(job_id: str) -> dict | None:
@@ -823,7 +947,6 @@ def get_jd_parsed(job_id: str) -> dict | None:
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM jd_parsed WHERE job_id = ?", (job_id,))
     row = cursor.fetchone()
-    conn.close()
     
     if row:
         result = dict(row)
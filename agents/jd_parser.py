@@ -3,9 +3,10 @@ JD Parser Agent - Extracts structured signals from job descriptions.
 
 Returns must-haves, skills, keywords, and normalized skill mappings.
 """
-from pathlib import Path
+from functools import lru_cache
 
 from .base import BaseAgent
+from .approved_skills import read_approved_skills
 
 
 class JDParserAgent(BaseAgent):
@@ -13,16 +14,11 @@ class JDParserAgent(BaseAgent):
     
     def __init__(self, model: str | None = None):
         super().__init__(model=model, temperature=0.2)
-        self._load_approved_skills()
     
-    def _load_approved_skills(self):
-        """Load approved skills for normalization."""
-        skills_path = Path("agent_prompts/approved_skills.md")
-        if skills_path.exists():
-            with open(skills_path) as f:
-                self.approved_skills = f.read()
-        else:
-            self.approved_skills = ""
+    @property
+    def approved_skills(self) -> str:
+        """Approved skills for normalization, re-read whenever the file changes."""
+        return read_approved_skills() or ""
     
     def get_system_prompt(self) -> str:
         return """You are a conservative JD-to-signals extractor.
@@ -70,6 +66,12 @@ Rules:
 Return the JSON now."""
 
 
+@lru_cache(maxsize=1)
+def get_jd_parser_agent() -> JDParserAgent:
+    """Get a cached JD parser agent, reusing its LLM client across calls."""
+    return JDParserAgent()
+
+
 def run_jd_parser_task(job_id: str, description_text: str):
     """
     Background task to run JD parsing and save results.
@@ -83,7 +85,7 @@ def run_jd_parser_task(job_id: str, description_text: str):
             return
 
         print(f"Starting background JD parsing for {job_id}...")
-        agent = JDParserAgent()
+        agent = get_jd_parser_agent()
         result = agent.run(job_id=job_id, description_text=description_text)
         
         # Save to DB
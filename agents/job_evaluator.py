@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 
 from .base import BaseAgent
+from .approved_skills import read_approved_skills
 from agents.database import get_master_resume
 from backend.settings import settings
 
@@ -19,17 +20,15 @@ class JobEvaluatorAgent(BaseAgent):
     
     def __init__(self, model: str | None = None):
         super().__init__(model=model, temperature=0.3)
-        self._load_resume()
-        self._load_approved_skills()
+        self.resume = self.load_resume()
     
-    def _load_resume(self):
+    def load_resume(self) -> dict:
         """Load base resume from DB (preferred) or JSON file."""
         # 1. Try DB
         try:
             db_resume = get_master_resume()
             if db_resume:
-                self.resume = self._normalize_resume(db_resume)
-                return
+                return self._normalize_resume(db_resume)
         except Exception as e:
             logger.warning(f"Failed to load resume from DB: {e}")
 
@@ -37,7 +36,7 @@ class JobEvaluatorAgent(BaseAgent):
         resume_path = Path("agent_prompts/base_resume.json")
         if resume_path.exists():
             with open(resume_path) as f:
-                self.resume = self._normalize_resume(json.load(f))
+                return self._normalize_resume(json.load(f))
         else:
             raise FileNotFoundError(f"Resume not found in DB or at {resume_path}")
     
@@ -98,14 +97,10 @@ class JobEvaluatorAgent(BaseAgent):
         logger.info(f"Normalized resume from frontend format. Work entries: {len(normalized['work'])}")
         return normalized
     
-    def _load_approved_skills(self):
-        """Load approved skills from markdown file."""
-        skills_path = Path("agent_prompts/approved_skills.md")
-        if skills_path.exists():
-            with open(skills_path) as f:
-                self.approved_skills = f.read()
-        else:
-            self.approved_skills = ""
+    @property
+    def approved_skills(self) -> str:
+        """Approved skills markdown, re-read whenever the file changes."""
+        return read_approved_skills() or ""
     
     def get_system_prompt(self) -> str:
         prompt_intro = f"""You are an AI Job Match Evaluator Agent.
@@ -206,12 +201,15 @@ Verdict mapping:
     def build_user_prompt(self, job_id: str, description_text: str, 
                           company_name: str = "Unknown", 
                           title: str = "Unknown",
-                          job_url: str = "Unknown") -> str:
+                          job_url: str = "Unknown",
+                          resume: dict | None = None) -> str:
+        # A per-call resume lets a shared agent see master resume edits
+        resume = resume if resume is not None else self.resume
         resume_str = json.dumps({
-            "basics": self.resume.get("basics", {}),
-            "work": self.resume.get("work", []),
-            "education": self.resume.get("education", []),
-            "skills": self.resume.get("skills", []),
+            "basics": resume.get("basics", {}),
+            "work": resume.get("work", []),
+            "education": resume.get("education", []),
+            "skills": resume.get("skills", []),
         }, indent=2)
         
         return f"""## INPUTS
@@ -1,4 +1,6 @@
 import json
+from functools import lru_cache
+
 from .base import BaseAgent
 
 RESUME_PARSER_SYSTEM_PROMPT = """
@@ -103,3 +105,8 @@ class ResumeParserAgent(BaseAgent):
     def build_user_prompt(self, resume_text: str) -> str:
         return f"Resume Text:\n\n{resume_text}"
 
+
+@lru_cache(maxsize=1)
+def get_resume_parser_agent() -> ResumeParserAgent:
+    """Get a cached resume parser agent, reusing its LLM client across calls."""
+    return ResumeParserAgent()
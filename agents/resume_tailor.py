@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 from agents.base import BaseAgent
 from agents.database import get_evaluation, is_job_parsed, get_jd_parsed
@@ -91,3 +92,8 @@ class ResumeTailorAgent(BaseAgent):
         
         return self.run(base_resume=base_resume, jd_context=jd_context, approved_skills=approved_skills)
 
+
+@lru_cache(maxsize=1)
+def get_resume_tailor_agent() -> ResumeTailorAgent:
+    """Get a cached resume tailor agent, reusing its LLM client across calls."""
+    return ResumeTailorAgent()
@@ -3,13 +3,30 @@ Supabase client for TailorAI.
 
 Provides connection to Supabase for storing evaluation results.
 """
+import asyncio
 from functools import lru_cache
 
-from supabase import create_client, Client
+import httpx
+from supabase import (
+    create_client,
+    acreate_client,
+    Client,
+    AsyncClient,
+    ClientOptions,
+    AsyncClientOptions,
+)
 
 from backend.settings import settings
 
 
+def _pool_limits() -> httpx.Limits:
+    """Connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE,
+    )
+
+
 @lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """Get a cached Supabase client instance."""
@@ -20,10 +37,42 @@ def get_supabase_client() -> Client:
     
     return create_client(
         settings.SUPABASE_URL,
-        settings.SUPABASE_SERVICE_KEY
+        settings.SUPABASE_SERVICE_KEY,
+        options=ClientOptions(httpx_client=httpx.Client(limits=_pool_limits())),
     )
 
 
+_async_client: AsyncClient | None = None
+# Serializes first-time creation, which awaits; without it concurrent first
+# requests could each build a client (and an httpx pool that is never closed)
+_async_client_lock = asyncio.Lock()
+
+
+async def get_async_supabase_client() -> AsyncClient:
+    """Get a cached async Supabase client instance.
+
+    Used by `async def` routes so PostgREST calls are awaited on the event
+    loop instead of holding a threadpool worker for the whole round-trip.
+    """
+    global _async_client
+    if _async_client is not None:
+        return _async_client
+    async with _async_client_lock:
+        if _async_client is None:
+            if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_KEY:
+                raise ValueError(
+                    "SUPABASE_URL and SUPABASE_SERVICE_KEY must be set in environment"
+                )
+            _async_client = await acreate_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_SERVICE_KEY,
+                options=AsyncClientOptions(
+                    httpx_client=httpx.AsyncClient(limits=_pool_limits())
+                ),
+            )
+    return _async_client
+
+
 def check_connection() -> bool:
     """Test Supabase connection."""
     try:
@@ -0,0 +1,42 @@
+"""
+HTTP caching helpers for read-only routes.
+
+Routes stamp an ETag derived from the payload they are about to return, and
+short-circuit with 304 Not Modified when the client already holds that copy.
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    payload: Any,
+    max_age: int = 0,
+) -> Response | None:
+    """Set ETag/Cache-Control headers and return a 304 if the client copy is current.
+
+    Args:
+        request: Incoming request (checked for If-None-Match).
+        response: The route's injected response, used for headers on a 200.
+        payload: The data the route would return.
+        max_age: Seconds the client may reuse its copy without revalidating.
+            0 means the client must revalidate on every request.
+
+    Returns:
+        A 304 response to return as-is, or None to return the payload normally.
+    """
+    digest = hashlib.md5(orjson.dumps(payload, default=str)).hexdigest()
+    etag = f'W/"{digest}"'
+    cache_control = f"private, max-age={max_age}" if max_age else "private, no-cache"
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    return None
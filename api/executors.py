@@ -0,0 +1,28 @@
+"""
+Dedicated thread pool for blocking LLM agent calls.
+
+Agent calls can take 20+ seconds. Running them on FastAPI's shared threadpool
+(run_in_threadpool) lets a handful of slow LLM requests use up the threads that
+sync routes and DB helpers need. Routes send agent work here instead.
+"""
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from backend.settings import settings
+
+T = TypeVar("T")
+
+_llm_executor = ThreadPoolExecutor(max_workers=settings.LLM_WORKERS, thread_name_prefix="llm")
+
+
+async def run_llm(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking agent call on the LLM pool and await its result.
+
+    The caller's contextvars are carried over, like run_in_threadpool does.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_llm_executor, functools.partial(ctx.run, func, *args, **kwargs))
@@ -3,8 +3,10 @@ TailorAI FastAPI Application
 
 REST API for job evaluation pipeline.
 """
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .routes import jobs, evaluations, parse, tasks, resumes
 
@@ -12,15 +14,19 @@ app = FastAPI(
     title="TailorAI API",
     description="Job evaluation and resume tailoring API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 from agents.database import init_database
+from backend.settings import settings
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     from backend.logging import setup_logging
     setup_logging()
     init_database()
+    # Sync routes and run_in_threadpool share anyio's limiter (40 threads by default)
+    to_thread.current_default_thread_limiter().total_tokens = settings.API_THREADPOOL_SIZE
 
 # CORS middleware for frontend
 app.add_middleware(
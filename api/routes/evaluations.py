@@ -1,16 +1,16 @@
 """
 Evaluations routes - Evaluate jobs and get results.
 """
-import json
 import logging
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Response
+import threading
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 
 from agents.supabase_client import get_supabase_client
 
 from backend.settings import settings
 from api.schemas import EvaluationResult, EvaluationStats, BatchRequest, MessageResponse
+from api.caching import conditional_response
 from agents.database import (
-    get_db_connection,
     is_job_evaluated,
     save_evaluation,
     get_evaluation,
@@ -22,6 +22,17 @@ from agents.job_evaluator import JobEvaluatorAgent
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_AGENT: JobEvaluatorAgent | None = None
+_agent_lock = threading.Lock()
+
+
+def get_agent() -> JobEvaluatorAgent:
+    """Get the process-wide evaluator agent, creating it on first use."""
+    global _AGENT
+    with _agent_lock:
+        if _AGENT is None:
+            _AGENT = JobEvaluatorAgent()
+        return _AGENT
 
 
 def get_job_by_id(job_id: str) -> dict | None:
@@ -57,29 +68,17 @@ def list_evaluations(
     # Set total count header for pagination
     response.headers["X-Total-Count"] = str(total_count)
     
-    results = []
-    for row_dict in rows:
-        # Parse JSON fields
-        for field in ["gaps", "improvement_suggestions", "interview_tips", "jd_keywords", "matched_keywords", "missing_keywords"]:
-            if row_dict.get(field) and isinstance(row_dict[field], str):
-                try:
-                    row_dict[field] = json.loads(row_dict[field])
-                except:
-                    pass
-        results.append(row_dict)
-    
-    return results
+    return rows
 
 
 @router.get("/stats", response_model=EvaluationStats)
 def get_evaluation_stats():
-    """Get evaluation statistics."""
     """Get evaluation statistics."""
     return get_evaluation_statistics()
 
 
 @router.get("/{job_id}", response_model=EvaluationResult)
-def get_evaluation_result(job_id: str):
+def get_evaluation_result(job_id: str, request: Request, response: Response):
     """Get evaluation result for a job."""
     evaluation = get_evaluation(job_id)
     
@@ -87,14 +86,9 @@ def get_evaluation_result(job_id: str):
         logger.warning(f"Evaluation not found for job {job_id}")
         raise HTTPException(status_code=404, detail=f"Evaluation for job {job_id} not found")
     
-    # Parse JSON fields
-    for field in ["gaps", "improvement_suggestions", "interview_tips", "jd_keywords", "matched_keywords", "missing_keywords"]:
-        if evaluation.get(field):
-            try:
-                evaluation[field] = json.loads(evaluation[field])
-            except:
-                pass
-    
+    not_modified = conditional_response(request, response, evaluation)
+    if not_modified:
+        return not_modified
     return evaluation
 
 
@@ -104,6 +98,7 @@ def run_batch_evaluation(task_id: str, max_jobs: int, only_unevaluated: bool, co
     """Background task for batch evaluation."""
     from agents.database import save_task_status
     import concurrent.futures
+    import functools
     import traceback
     
     logger.info(f"Starting batch evaluation task {task_id}", extra={"task_id": task_id, "max_jobs": max_jobs})
@@ -164,17 +159,24 @@ def run_batch_evaluation(task_id: str, max_jobs: int, only_unevaluated: bool, co
         # Save initial count
         save_task_status(task_id, "running", {"completed": 0, "total": total_jobs, "failed": 0})
         
+        # Master resume read once per batch; a failed load is not cached, so it
+        # surfaces as that job's error and the next job retries it
+        @functools.cache
+        def batch_resume() -> dict:
+            return get_agent().load_resume()
+        
         def process_singe_job(row):
             job_id = str(row.get("id", ""))
             logger.debug(f"Processing job {job_id} in batch")
             try:
-                agent = JobEvaluatorAgent()
+                agent = get_agent()
                 result = agent.run(
                     job_id=job_id,
                     description_text=row.get("description_text", ""),
                     company_name=row.get("company_name", "Unknown"),
                     title=row.get("title", "Unknown"),
                     job_url=row.get("link", "Unknown"),
+                    resume=batch_resume(),
                 )
                 
                 # --- Smart Conditional Parsing Logic ---
@@ -285,13 +287,14 @@ def evaluate_job(job_id: str, background_tasks: BackgroundTasks, force: bool = F
     # Run evaluation
     try:
         logger.info(f"Starting evaluation suitable for job {job_id}")
-        agent = JobEvaluatorAgent()
+        agent = get_agent()
         result = agent.run(
             job_id=job_id,
             description_text=job.get("description_text", ""),
             company_name=job.get("company_name", "Unknown"),
             title=job.get("title", "Unknown"),
             job_url=job.get("link", "Unknown"),
+            resume=agent.load_resume(),  # Pick up master resume edits since the agent was built
         )
         save_evaluation(result)
         
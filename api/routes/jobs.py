@@ -1,21 +1,34 @@
 """
 Jobs routes - Read jobs directly from App DB (Supabase).
 """
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException, Query
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from agents.supabase_client import get_supabase_client
+from agents.supabase_client import get_async_supabase_client
 from backend.settings import settings
 from services.scraper_service import ScraperService
 from api.schemas import JobBase, JobDetail, JobStats, DeleteRequest
+from api.caching import conditional_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Columns needed to build a JobBase; list pages skip the large description fields
+JOB_LIST_COLUMNS = ",".join(JobBase.model_fields)
+
+# Job stats per (company, is_evaluated) filter; counts need not be real-time
+_stats_cache: TTLCache = TTLCache(maxsize=32, ttl=60)
+
+# Max IDs per soft-delete request (keeps the PostgREST URL within server limits)
+DELETE_BATCH_SIZE = 500
+
 
 @router.get("", response_model=list[JobBase])
-def list_jobs(
+async def list_jobs(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=10000),
     company: str | None = Query(None, description="Filter by company name"),
@@ -26,32 +39,18 @@ def list_jobs(
         logger.error("Supabase backend not enabled in settings but route accessed")
         raise HTTPException(status_code=503, detail="Supabase backend not enabled")
 
-    client = get_supabase_client()
+    client = await get_async_supabase_client()
     
     # Base query: Active jobs only
-    query = client.table("jobs").select("*").eq("status", "active")
+    # jobs_with_eval joins evaluation status server-side (migration 004)
+    query = client.table("jobs_with_eval").select(JOB_LIST_COLUMNS).eq("status", "active")
     
     # Apply filters
     if company:
         query = query.ilike("company_name", f"%{company}%")
 
     if is_evaluated is not None:
-        # Get all evaluated IDs (optimized: only select ID)
-        try:
-            eval_result = client.table("job_evaluations").select("job_id").execute()
-            evaluated_ids = [r['job_id'] for r in eval_result.data]
-
-            if is_evaluated:
-                if not evaluated_ids:
-                    return [] # No evaluated jobs
-                query = query.in_("id", evaluated_ids)
-            else:
-                if evaluated_ids:
-                    query = query.not_.in_("id", evaluated_ids)
-        except Exception as e:
-            logger.error(f"Failed to filter by is_evaluated: {e}", exc_info=True)
-            # Fallback: ignore filter or raise? Raising is safer to notice bug
-            raise HTTPException(status_code=500, detail="Filter processing failed")
+        query = query.eq("is_evaluated", is_evaluated)
     
     # Pagination
     # Supabase range is inclusive
@@ -60,7 +59,7 @@ def list_jobs(
     logger.debug(f"Listing jobs skip={skip} limit={limit} company={company} is_evaluated={is_evaluated}")
     
     try:
-        result = query.order("posted_at", desc=True).range(skip, end).execute()
+        result = await query.order("posted_at", desc=True).range(skip, end).execute()
         
         if not result.data:
             return []
@@ -71,42 +70,22 @@ def list_jobs(
         raise HTTPException(status_code=500, detail="Database query failed")
 
 
-@router.get("/stats", response_model=JobStats)
-def get_job_stats(
-    company: str | None = Query(None, description="Filter by company"),
-    is_evaluated: bool | None = Query(None, description="Filter by evaluation status"),
-):
-    """Get aggregate job statistics."""
-    if not settings.USE_SUPABASE:
-        raise HTTPException(status_code=503, detail="Supabase backend not enabled")
-        
-    client = get_supabase_client()
+async def _fetch_job_stats(company: str | None, is_evaluated: bool | None) -> dict:
+    """Query aggregate job statistics from App DB."""
+    client = await get_async_supabase_client()
     
     # Base query
-    query = client.table("jobs").select("*", count="exact", head=True).eq("status", "active")
+    query = client.table("jobs_with_eval").select("*", count="exact", head=True).eq("status", "active")
 
     if company:
         query = query.ilike("company_name", f"%{company}%")
 
     if is_evaluated is not None:
-        eval_result = client.table("job_evaluations").select("job_id").execute()
-        evaluated_ids = [r['job_id'] for r in eval_result.data]
-
-        if is_evaluated:
-             if not evaluated_ids:
-                 pass # Will resolve to 0 matches logically if we could force it, 
-                      # but query builder is additive.
-                      # Ideally we query .in_([], []) which returns 0.
-                 query = query.in_("id", ["00000000-0000-0000-0000-000000000000"]) # Dummy
-             else:
-                 query = query.in_("id", evaluated_ids)
-        else:
-             if evaluated_ids:
-                 query = query.not_.in_("id", evaluated_ids)
+        query = query.eq("is_evaluated", is_evaluated)
     
     # Execute count
     try:
-        total = query.execute().count or 0
+        total = (await query.execute()).count or 0
         return {
             "total_jobs": total,
             "unique_companies": 0, # Placeholder until we add RPC or View
@@ -117,59 +96,115 @@ def get_job_stats(
         raise HTTPException(status_code=500, detail="Failed to fetch stats")
 
 
+@router.get("/stats", response_model=JobStats)
+async def get_job_stats(
+    request: Request,
+    response: Response,
+    company: str | None = Query(None, description="Filter by company"),
+    is_evaluated: bool | None = Query(None, description="Filter by evaluation status"),
+):
+    """Get aggregate job statistics."""
+    if not settings.USE_SUPABASE:
+        raise HTTPException(status_code=503, detail="Supabase backend not enabled")
+        
+    cache_key = (company, is_evaluated)
+    stats = _stats_cache.get(cache_key)
+    if stats is None:
+        stats = await _fetch_job_stats(company, is_evaluated)
+        _stats_cache[cache_key] = stats
+
+    not_modified = conditional_response(request, response, stats, max_age=30)
+    if not_modified:
+        return not_modified
+    return stats
+
+
 @router.get("/{job_id}", response_model=JobDetail)
-def get_job(job_id: str):
+async def get_job(job_id: str, request: Request, response: Response):
     """Get single job details."""
     if not settings.USE_SUPABASE:
         raise HTTPException(status_code=503, detail="Supabase backend not enabled")
         
-    client = get_supabase_client()
+    client = await get_async_supabase_client()
     
-    result = client.table("jobs").select("*").eq("id", job_id).execute()
+    result = await client.table("jobs").select("*").eq("id", job_id).execute()
     
     if not result.data:
         logger.warning(f"Job {job_id} not found")
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     
-    return result.data[0]
+    job = result.data[0]
+    not_modified = conditional_response(request, response, job)
+    if not_modified:
+        return not_modified
+    return job
 
 
 @router.delete("", status_code=204)
-def delete_jobs(request: DeleteRequest):
+async def delete_jobs(request: DeleteRequest):
     """Bulk soft-delete jobs."""
     if not settings.USE_SUPABASE:
         raise HTTPException(status_code=503, detail="Supabase backend not enabled")
 
-    client = get_supabase_client()
+    client = await get_async_supabase_client()
     
     # Update status to 'deleted' for all IDs
-    # Supabase 'in_' filter works for lists
-    logger.info(f"Deleting {len(request.ids)} jobs")
+    # PostgREST encodes the 'in_' list into the URL, so large selections are
+    # split into chunks that are sent concurrently
+    ids = request.ids
+    logger.info(f"Deleting {len(ids)} jobs")
     try:
-        (
+        await asyncio.gather(*(
             client.table("jobs")
             .update({"status": "deleted"})
-            .in_("id", request.ids)
+            .in_("id", ids[i:i + DELETE_BATCH_SIZE])
             .execute()
-        )
+            for i in range(0, len(ids), DELETE_BATCH_SIZE)
+        ))
     except Exception as e:
         logger.error("Failed to delete jobs", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to delete jobs: {e}")
     
+    _stats_cache.clear()
     return
 
 
 class ImportRequest(BaseModel):
     url: str
 
+
+class BatchImportRequest(BaseModel):
+    urls: list[str]
+
+# The import routes are async and run the blocking scrape in the threadpool, so
+# _stats_cache (a TTLCache, not thread-safe) is only ever touched on the event loop
+
 @router.post("/import", status_code=201)
-def import_job(request: ImportRequest):
+async def import_job(request: ImportRequest):
     """Import a job from a LinkedIn URL via Apify."""
     logger.info(f"Importing job from URL: {request.url}")
     try:
-        result = ScraperService.scrape_and_import(request.url)
+        result = await run_in_threadpool(ScraperService.scrape_and_import, request.url)
+        _stats_cache.clear()
         logger.info(f"Import successful. ID: {result.get('id')}")
         return result
     except Exception as e:
         logger.error(f"Import failed for {request.url}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/import/batch", status_code=201)
+async def import_jobs_batch(request: BatchImportRequest):
+    """Import jobs from several LinkedIn URLs with a single Apify run."""
+    if not request.urls:
+        raise HTTPException(status_code=400, detail="No URLs provided")
+
+    logger.info(f"Batch importing jobs from {len(request.urls)} URLs")
+    try:
+        result = await run_in_threadpool(ScraperService.scrape_and_import_many, request.urls)
+        _stats_cache.clear()
+        logger.info(f"Batch import successful. Imported {result.get('count')} jobs")
+        return result
+    except Exception as e:
+        logger.error("Batch import failed", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,11 +1,9 @@
 """
 Parse routes - Parse JD for evaluated jobs.
 """
-import json
+import orjson
 from fastapi import APIRouter, HTTPException
 
-from agents.supabase_client import get_supabase_client
-
 from backend.settings import settings
 from api.schemas import ParseResult, MessageResponse
 from agents.database import (
@@ -15,45 +13,37 @@ from agents.database import (
     save_jd_parsed,
     get_evaluation,
 )
-from agents.jd_parser import JDParserAgent
+from agents.jd_parser import get_jd_parser_agent
+from api.routes.evaluations import get_job_by_id
 
 router = APIRouter()
 
+# Only the ParseResult columns; skips raw_response and other unused TEXT blobs
+GET_PARSED_JD_SQL = """
+    SELECT job_id, must_haves, nice_to_haves, domain, seniority,
+           ats_keywords, normalized_skills, parsed_at
+    FROM jd_parsed
+    WHERE job_id = ?
+    LIMIT 1
+"""
 
-
-def get_job_by_id(job_id: str) -> dict | None:
-    client = get_supabase_client()
-    result = client.table("jobs").select("*").eq("id", job_id).execute()
-    
-    if not result.data:
-        return None
-        
-    return result.data[0]
+# ParseResult fields stored as JSON TEXT in SQLite
+PARSED_JD_JSON_FIELDS = ("must_haves", "nice_to_haves", "ats_keywords", "normalized_skills")
 
 
 @router.get("/{job_id}", response_model=ParseResult)
 def get_parsed_jd(job_id: str):
     """Get parsed JD signals for a job."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM jd_parsed WHERE job_id = ?", (job_id,))
-    row = cursor.fetchone()
-    conn.close()
+    row = get_db_connection().execute(GET_PARSED_JD_SQL, (job_id,)).fetchone()
     
     if not row:
         raise HTTPException(status_code=404, detail=f"Parsed JD for job {job_id} not found")
     
-    result = dict(row)
-    
-    # Parse JSON fields
-    for field in ["must_haves", "nice_to_haves", "location_constraints", "ats_keywords", "normalized_skills"]:
-        if result.get(field):
-            try:
-                result[field] = json.loads(result[field])
-            except:
-                pass
-    
-    return result
+    # Decode JSON fields straight from the row (written by save_jd_parsed via json.dumps)
+    return {
+        key: orjson.loads(row[key]) if key in PARSED_JD_JSON_FIELDS and row[key] else row[key]
+        for key in row.keys()
+    }
 
 
 @router.post("/{job_id}", response_model=MessageResponse)
@@ -80,7 +70,7 @@ def parse_jd(job_id: str, force: bool = False):
     
     # Run parser
     try:
-        agent = JDParserAgent()
+        agent = get_jd_parser_agent()
         result = agent.run(
             job_id=job_id,
             description_text=job.get("description_text", ""),
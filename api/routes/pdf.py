@@ -1,6 +1,7 @@
-import json
 import os
-import tempfile
+import threading
+from functools import lru_cache
+
 import typst
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from fastapi.responses import Response, FileResponse
@@ -12,11 +13,33 @@ from api.schemas import ResumeData
 router = APIRouter()
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../templates")
+# One entrypoint per template; each reads the resume JSON from sys.inputs
+ENTRYPOINTS_DIR = os.path.join(TEMPLATES_DIR, "entrypoints")
+DEFAULT_TEMPLATE = "modern"
+
+# Templates that have a compilation entrypoint
+AVAILABLE_TEMPLATES = {
+    os.path.splitext(name)[0]
+    for name in os.listdir(ENTRYPOINTS_DIR)
+    if name.endswith(".typ")
+}
 
 class Helper:
     # Just a helper for the route
     pass
 
+
+@lru_cache(maxsize=None)
+def _get_compiler(template: str) -> tuple[typst.Compiler, threading.Lock]:
+    """Get the persistent compiler for a template and the lock guarding it.
+    
+    The compiler keeps the parsed template and loaded fonts between requests.
+    It is not safe to use concurrently, so callers must hold the lock.
+    """
+    entrypoint_path = os.path.join(ENTRYPOINTS_DIR, f"{template}.typ")
+    return typst.Compiler(entrypoint_path, root=TEMPLATES_DIR), threading.Lock()
+
+
 @router.post("/generate")
 def generate_pdf(data: ResumeData, template: str = "modern"):
     """
@@ -24,57 +47,20 @@ def generate_pdf(data: ResumeData, template: str = "modern"):
     """
     
     # Validate template exists
-    template_path = os.path.join(TEMPLATES_DIR, f"{template}.typ")
-    if not os.path.exists(template_path):
+    if template not in AVAILABLE_TEMPLATES:
         # Fallback to modern if not found
-        template_path = os.path.join(TEMPLATES_DIR, "modern.typ")
+        template = DEFAULT_TEMPLATE
         
     try:
-        # Create a temporary directory for compilation context
-        with tempfile.TemporaryDirectory() as temp_dir:
-            
-            # 1. Write data.json
-            data_dict = data.dict()
-            json_path = os.path.join(temp_dir, "data.json")
-            with open(json_path, "w") as f:
-                json.dump(data_dict, f)
-                
-            # 2. Copy the template file to temp dir (to resolve local imports if any)
-            # OR better: structure the entrypoint to import from absolute path? 
-            # Typst might be strict about paths. Safer to copy template content.
-            
-            with open(template_path, "r") as f:
-                template_content = f.read()
-                
-            # 3. Create entrypoint.typ
-            # We explicitly call the 'resume' function defined in the template
-            entrypoint_content = f"""
-import "{template}.typ": resume
-#let data = json("data.json")
-#show: resume(data)
-"""
-            # We need to make sure the template file is available in the temp dir as '{template}.typ'
-            # So we write the content we read back to a file in temp_dir
-            with open(os.path.join(temp_dir, f"{template}.typ"), "w") as f:
-                f.write(template_content)
-                
-            entrypoint_path = os.path.join(temp_dir, "main.typ")
-            with open(entrypoint_path, "w") as f:
-                f.write(entrypoint_content)
-                
-            # 4. Compile
-            output_pdf_path = os.path.join(temp_dir, "resume.pdf")
-            typst.compile(entrypoint_path, output=output_pdf_path)
+        compiler, lock = _get_compiler(template)
+        with lock:
+            pdf_bytes = compiler.compile(sys_inputs={"data": data.model_dump_json()})
             
-            # 5. Read PDF bytes
-            with open(output_pdf_path, "rb") as f:
-                pdf_bytes = f.read()
-                
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={"Content-Disposition": f"attachment; filename=resume_{template}.pdf"}
-            )
+        return Response(
+            content=pdf_bytes,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f"attachment; filename=resume_{template}.pdf"}
+        )
 
     except Exception as e:
         print(f"PDF Generation Error: {e}")
@@ -1,30 +1,38 @@
-import json
+import asyncio
+import hashlib
+import orjson
 import os
-import shutil
+import tempfile
 from typing import Annotated
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-import pdfplumber
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Request, Response
 from datetime import datetime
+from pathlib import Path
 
-from agents.resume_parser import ResumeParserAgent
+from agents.resume_parser import get_resume_parser_agent
+from services.pdf_extractor import extract_pdf_text
+from backend.settings import settings
 
 router = APIRouter()
 
-MASTER_RESUME_PATH = "/Users/abhijithm/Documents/Code/TailorAI/test/master_resume.json"
-UPLOAD_DIR = "/Users/abhijithm/Documents/Code/TailorAI/uploads"
+MASTER_RESUME_PATH = Path(settings.MASTER_RESUME_PATH)
+UPLOAD_DIR = Path(settings.RESUME_UPLOAD_DIR)
 
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 from agents.database import (
     get_master_resume as get_db_master_resume, 
+    get_master_resume_id,
     save_resume,
     save_tailored_resume,
     get_tailored_resumes,
+    get_next_tailored_version,
     update_tailored_resume_status
 )
-from agents.resume_tailor import ResumeTailorAgent
+from agents.resume_tailor import get_resume_tailor_agent
+from agents.approved_skills import read_approved_skills
+from api.caching import conditional_response
+from api.executors import run_llm
 
-APPROVED_SKILLS_PATH = "agent_prompts/approved_skills.md"
 
 def _to_frontend_format(json_resume: dict) -> dict:
     """Transform JSON Resume format to frontend format for the Editor.
@@ -73,25 +81,46 @@ def _to_frontend_format(json_resume: dict) -> dict:
         "skills": json_resume.get("skills", [])
     }
 
+# (master resume record ID, frontend-format resume) for the last master served
+_master_cache: tuple[str, dict] | None = None
+
+
 @router.get("/master")
-def get_master_resume():
+def get_master_resume(request: Request, response: Response):
     """Get the current master resume JSON in frontend format."""
-    resume = get_db_master_resume()
-    if resume:
-        return _to_frontend_format(resume)
+    global _master_cache
+    record_id = get_master_resume_id()
+    if record_id:
+        if _master_cache is None or _master_cache[0] != record_id:
+            resume = get_db_master_resume()
+            if resume:
+                _master_cache = (record_id, _to_frontend_format(resume))
+        if _master_cache is not None and _master_cache[0] == record_id:
+            payload = _master_cache[1]
+            not_modified = conditional_response(request, response, payload)
+            if not_modified:
+                return not_modified
+            return payload
         
     # Fallback to file for backward compatibility during migration
-    if os.path.exists(MASTER_RESUME_PATH):
-        try:
-            with open(MASTER_RESUME_PATH, "r") as f:
-                return _to_frontend_format(json.load(f))
-        except:
-            pass
+    try:
+        return _to_frontend_format(orjson.loads(MASTER_RESUME_PATH.read_bytes()))
+    except Exception:
+        pass
             
     raise HTTPException(status_code=404, detail="Master resume not found. Please upload a resume first.")
 
 from api.schemas import ResumeData
 
+JSON_RESUME_SCHEMA_URL = "https://raw.githubusercontent.com/jsonresume/resume-schema/v1.0.0/schema.json"
+
+
+def _split_period(period: str) -> tuple[str, str]:
+    """Split a frontend "start - end" period into JSON Resume start/end dates."""
+    start, sep, end = period.partition(" - ")
+    return (start, end) if sep else (period, "Present")
+
+
 def _to_json_resume_format(data: dict) -> dict:
     """Transform frontend resume format to JSON Resume format.
     
@@ -105,7 +134,7 @@ def _to_json_resume_format(data: dict) -> dict:
         return data
         
     return {
-        "$schema": "https://raw.githubusercontent.com/jsonresume/resume-schema/v1.0.0/schema.json",
+        "$schema": JSON_RESUME_SCHEMA_URL,
         "basics": {
             "name": data.get("fullName", ""),
             "label": data.get("title", ""),
@@ -121,11 +150,12 @@ def _to_json_resume_format(data: dict) -> dict:
                 "name": exp.get("company", ""),
                 "position": exp.get("role", ""),
                 "location": exp.get("location", ""),
-                "startDate": exp.get("period", "").split(" - ")[0] if " - " in exp.get("period", "") else exp.get("period", ""),
-                "endDate": exp.get("period", "").split(" - ")[1] if " - " in exp.get("period", "") else "Present",
+                "startDate": start,
+                "endDate": end,
                 "highlights": exp.get("achievements", [])
             }
             for exp in data.get("experience", [])
+            for start, end in (_split_period(exp.get("period", "")),)
         ],
         "education": [
             {
@@ -156,13 +186,16 @@ def update_master_resume(resume: ResumeData):
         # Transform to JSON Resume format for storage
         json_resume_content = _to_json_resume_format(frontend_data)
         
+        # Saving an unchanged resume would only add a duplicate master row
+        if get_db_master_resume() == json_resume_content:
+            return {"status": "success", "message": "Resume updated successfully"}
+        
         # Save as new master version
         save_resume(json_resume_content, name="Master Resume", is_master=True)
         
         # Also update file backup for redundancy
-        if os.path.exists(MASTER_RESUME_PATH):
-             with open(MASTER_RESUME_PATH, "w") as f:
-                json.dump(json_resume_content, f, indent=2)
+        if MASTER_RESUME_PATH.is_file():
+             _write_bytes(MASTER_RESUME_PATH, orjson.dumps(json_resume_content, option=orjson.OPT_INDENT_2))
                 
         return {"status": "success", "message": "Resume updated successfully"}
     except Exception as e:
@@ -172,27 +205,99 @@ def update_master_resume(resume: ResumeData):
 
 from fastapi.concurrency import run_in_threadpool
 
-async def process_resume_background(full_text: str):
-    """Background task to parse resume and save to DB."""
+# Bounds concurrent resume-parsing LLM calls so uploads cannot pile up work in the API process
+_parse_semaphore = asyncio.Semaphore(settings.RESUME_PARSE_CONCURRENCY)
+
+# Parsing tasks in flight, keyed by a hash of the uploaded PDF bytes
+_inflight_parses: dict[str, asyncio.Task] = {}
+
+def _write_bytes(file_path: Path, data: bytes):
+    """Atomically write bytes to a file.
+    
+    Writes to a uniquely named temporary file next to the target and renames
+    it into place, so a crash mid-write never leaves a truncated file behind
+    and concurrent writers of the same file never share a temp file.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        tmp_path = f.name
     try:
-        agent = ResumeParserAgent()
-        result = await run_in_threadpool(agent.run, resume_text=full_text)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+async def process_resume_background(data: bytes, processing_id: str):
+    """Background task to extract text from an uploaded PDF, parse it and save to DB.
+    
+    Re-uploading the same PDF while it is still being parsed shares the
+    running task instead of spending a second LLM call on identical input.
+    Each upload inserts its own "processing" master row (processing_id). If a
+    waiter's row is still the latest master once the shared task is done, it
+    re-saves the result; otherwise its row would remain "processing" forever.
+    A newer master (the shared result or a manual edit) is left alone.
+    """
+    key = hashlib.blake2b(data).hexdigest()
+    task = _inflight_parses.get(key)
+    if task is not None:
+        print("Resume already being parsed, waiting on the in-flight task")
+        content = await asyncio.shield(task)
+        if await run_in_threadpool(get_master_resume_id) == processing_id:
+            await _save_master(content)
+        return
+
+    task = asyncio.create_task(_process_resume(data))
+    _inflight_parses[key] = task
+    try:
+        await task
+    finally:
+        _inflight_parses.pop(key, None)
+
+
+async def _save_master(content: dict) -> dict:
+    """Save content as the latest master resume and return it."""
+    await run_in_threadpool(save_resume, content, name="Master Resume", is_master=True)
+    return content
+
+
+async def _process_resume(data: bytes) -> dict:
+    """Extract text from an uploaded PDF, parse it and save the result to DB.
+    
+    Returns the master content that was saved (the parsed resume or an error).
+    """
+    try:
+        full_text = await run_in_threadpool(extract_pdf_text, data)
+        if not full_text:
+            print("Background parsing failed: could not extract text from PDF")
+            return await _save_master({"status": "error", "error": "Could not extract text from PDF"})
+
+        agent = get_resume_parser_agent()
+        async with _parse_semaphore:
+            result = await run_llm(agent.run, resume_text=full_text)
         
         if "error" not in result:
              # Save final results
-             save_resume(result, name="Master Resume", is_master=True)
+             await _save_master(result)
              
              # Also update file backup
-             with open(MASTER_RESUME_PATH, "w") as f:
-                json.dump(result, f, indent=2)
+             await run_in_threadpool(
+                 _write_bytes, MASTER_RESUME_PATH, orjson.dumps(result, option=orjson.OPT_INDENT_2)
+             )
+             return result
         else:
             print(f"Background parsing failed: {result.get('error')}")
             # Save error status so UI can show it
-            save_resume({"status": "error", "error": result.get("error")}, is_master=True)
+            return await _save_master({"status": "error", "error": result.get("error")})
             
     except Exception as e:
         print(f"Background parsing exception: {e}")
-        save_resume({"status": "error", "error": str(e)}, is_master=True)
+        return await _save_master({"status": "error", "error": str(e)})
 
 @router.post("/upload")
 async def upload_resume(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
@@ -200,30 +305,21 @@ async def upload_resume(background_tasks: BackgroundTasks, file: UploadFile = Fi
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
+    file_path = UPLOAD_DIR / file.filename
     
     try:
-        # Save uploaded file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-            
-        # Extract text using pdfplumber
-        full_text = ""
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    full_text += text + "\n\n"
-        
-        if not full_text:
-            raise HTTPException(status_code=400, detail="Could not extract text from PDF")
+        # Read the upload once; extraction and the disk copy share the same bytes
+        data = await file.read()
+
+        # Keep a copy of the uploaded file (written after the response)
+        background_tasks.add_task(_write_bytes, file_path, data)
 
         # Save immediate "processing" state to DB
         processing_status = {"status": "processing", "uploaded_at": datetime.now().isoformat()}
-        save_resume(processing_status, name="Master Resume", is_master=True)
+        processing_id = await run_in_threadpool(save_resume, processing_status, name="Master Resume", is_master=True)
 
-        # Trigger background parsing
-        background_tasks.add_task(process_resume_background, full_text)
+        # Trigger background extraction + parsing
+        background_tasks.add_task(process_resume_background, data, processing_id)
         
         return processing_status
 
@@ -239,12 +335,14 @@ async def tailor_resume(job_id: str):
     """
     try:
         # 1. Get Base Resume
-        base_resume = get_db_master_resume()
+        # DB helpers are blocking (sqlite / sync Supabase), so keep them off the event loop
+        base_resume = await run_in_threadpool(get_db_master_resume)
         if not base_resume:
              # Fallback
-             if os.path.exists(MASTER_RESUME_PATH):
-                 with open(MASTER_RESUME_PATH, "r") as f:
-                     base_resume = json.load(f)
+             try:
+                 base_resume = orjson.loads(MASTER_RESUME_PATH.read_bytes())
+             except FileNotFoundError:
+                 pass
         
         if not base_resume:
             raise HTTPException(status_code=400, detail="No base resume found.")
@@ -256,21 +354,19 @@ async def tailor_resume(job_id: str):
             raise HTTPException(status_code=400, detail="No base resume found.")
 
         # 2. Get Approved Skills
-        approved_skills = ""
-        if os.path.exists(APPROVED_SKILLS_PATH):
-            with open(APPROVED_SKILLS_PATH, "r") as f:
-                approved_skills = f.read()
-        else:
+        approved_skills = read_approved_skills()
+        if approved_skills is None:
+            approved_skills = ""
             print("Warning: Approved skills file not found.")
 
         # 3. Run Agent
-        agent = ResumeTailorAgent()
+        agent = get_resume_tailor_agent()
         # Note: Run synchronously for now as it's a critical User-initiated action, 
         # but could be backgrounded if slow (>20s). 
         # Given "Conservative Editor" (40% rule), it should be fast-ish.
-        # But to be safe on timeouts, let's allow it to block or use run_in_threadpool.
+        # Runs on the dedicated LLM pool so it cannot starve the request threadpool.
         
-        tailored_content = await run_in_threadpool(
+        tailored_content = await run_llm(
             agent.run_tailoring, 
             job_id=job_id, 
             base_resume=base_resume, 
@@ -279,10 +375,11 @@ async def tailor_resume(job_id: str):
         
         # 4. Save Result
         # Determine version number
-        existing = get_tailored_resumes(job_id)
-        version = len(existing) + 1
+        version = await run_in_threadpool(get_next_tailored_version, job_id)
         
-        record_id = save_tailored_resume(job_id, version, tailored_content, status="pending")
+        record_id = await run_in_threadpool(
+            save_tailored_resume, job_id, version, tailored_content, status="pending"
+        )
         
         return {
             "id": record_id,
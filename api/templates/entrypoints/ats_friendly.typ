@@ -0,0 +1,5 @@
+// Compilation entrypoint for ats_friendly.typ.
+// Resume data is passed in as JSON through sys.inputs.data.
+#import "../ats_friendly.typ": resume
+#let data = json(bytes(sys.inputs.data))
+#show: resume(data)
@@ -0,0 +1,5 @@
+// Compilation entrypoint for modern.typ.
+// Resume data is passed in as JSON through sys.inputs.data.
+#import "../modern.typ": resume
+#let data = json(bytes(sys.inputs.data))
+#show: resume(data)
@@ -1,10 +1,19 @@
-import json
+import orjson
 import logging
 import logging.config
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
+# Standard LogRecord attributes; anything else on a record came from extra={}
+_STANDARD_ATTRS = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname", "filename",
+    "module", "exc_info", "exc_text", "stack_info", "lineno", "funcName",
+    "created", "msecs", "relativeCreated", "thread", "threadName",
+    "processName", "process", "message", "asctime"
+})
+
+
 class JSONFormatter(logging.Formatter):
     """
     Formatter that outputs JSON strings after parsing the LogRecord.
@@ -21,9 +30,14 @@ class JSONFormatter(logging.Formatter):
         if self.usesTime():
             record.asctime = self.formatTime(record, self.datefmt)
 
+        # Fall back to the record's own creation time rather than reading the clock again
+        timestamp = getattr(record, "asctime", None)
+        if timestamp is None:
+            timestamp = datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()
+
         # Base log object
         log_record = {
-            "timestamp": getattr(record, "asctime", datetime.utcnow().isoformat()),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
             "message": record.message,
@@ -40,22 +54,15 @@ class JSONFormatter(logging.Formatter):
             
         # Add extra fields (context) passed via extra={}
         # We filter out standard LogRecord attributes to avoid clutter
-        standard_attrs = {
-            "name", "msg", "args", "levelname", "levelno", "pathname", "filename",
-            "module", "exc_info", "exc_text", "stack_info", "lineno", "funcName",
-            "created", "msecs", "relativeCreated", "thread", "threadName",
-            "processName", "process", "message", "asctime"
-        }
-        
         for key, value in record.__dict__.items():
-            if key not in standard_attrs and not key.startswith("_"):
+            if key not in _STANDARD_ATTRS and key[0] != "_":
                 # Add to a 'context' sub-object or root? 
                 # Strategy said root for context or 'context' key.
                 # Let's put specific extras at root for easier parsing (e.g. url, method)
                 # or group them. Datadog prefers root attributes.
                 log_record[key] = value
 
-        return json.dumps(log_record, default=str)
+        return orjson.dumps(log_record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def setup_logging(config_path="backend/logging_config.json", logs_dir="logs"):
@@ -68,8 +75,7 @@ def setup_logging(config_path="backend/logging_config.json", logs_dir="logs"):
     Path(logs_dir).mkdir(parents=True, exist_ok=True)
     
     if path.exists():
-        with open(path, 'rt') as f:
-            config = json.load(f)
+        config = orjson.loads(path.read_bytes())
         
         # Apply configuration
         logging.config.dictConfig(config)
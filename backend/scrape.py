@@ -1,7 +1,8 @@
 from apify_client import ApifyClient
+import urllib3
 from minio import Minio
 from minio.error import S3Error
-import json
+import orjson
 import logging
 from datetime import datetime
 from io import BytesIO
@@ -16,11 +17,18 @@ logger = logging.getLogger(__name__)
 client = ApifyClient(settings.APIFY_TOKEN)
 
 # Initialize MinIO client
+# Short connect timeout and quick retries on 503/504 so an unavailable node
+# fails fast instead of stalling on the library's 5 minute default timeout
 minio_client = Minio(
     settings.MINIO_ENDPOINT,
     access_key=settings.MINIO_ACCESS_KEY,
     secret_key=settings.MINIO_SECRET_KEY,
-    secure=settings.MINIO_SECURE
+    secure=settings.MINIO_SECURE,
+    http_client=urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=settings.MINIO_CONNECT_TIMEOUT, read=settings.MINIO_READ_TIMEOUT),
+        maxsize=10,
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    ),
 )
 
 # Ensure bucket exists
@@ -50,10 +58,9 @@ except Exception as e:
     logger.critical(f"Apify actor execution failed: {e}", exc_info=True)
     raise
 
-results = []
-# Fetch and print Actor results from the run's dataset (if there are any)
-for item in client.dataset(run["defaultDatasetId"]).iterate_items():
-    results.append(item)
+# Fetch the Actor results from the run's dataset in a single request
+# (a run yields at most run_input["count"] items, well within one page)
+results = client.dataset(run["defaultDatasetId"]).list_items().items
 
 logger.info(f"Scraped {len(results)} jobs from Apify")
 
@@ -63,9 +70,9 @@ partition_path = ingestion_date.strftime("%Y-%m-%d")
 timestamp = ingestion_date.strftime("%H%M%S")
 object_name = f"{partition_path}/jobs_{timestamp}.json"
 
-# Convert results to JSON bytes
-json_data = json.dumps(results, indent=4)
-json_bytes = json_data.encode('utf-8')
+# Convert results to JSON bytes (orjson encodes straight to UTF-8 bytes);
+# indent only when debugging, it is dead weight in the raw layer
+json_bytes = orjson.dumps(results, option=orjson.OPT_INDENT_2 if settings.DEBUG else None)
 json_stream = BytesIO(json_bytes)
 
 # Upload to MinIO
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from pathlib import Path
+from functools import cached_property, lru_cache
 
 # Resolve .env path relative to this file's location
 ENV_FILE = Path(__file__).parent.parent / ".env"
@@ -17,6 +18,8 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str = Field("minioadmin", env="MINIO_SECRET_KEY")
     MINIO_BUCKET: str = Field("scraped-jobs", env="MINIO_BUCKET")
     MINIO_SECURE: bool = Field(False, env="MINIO_SECURE")
+    MINIO_CONNECT_TIMEOUT: float = Field(3.0, env="MINIO_CONNECT_TIMEOUT")
+    MINIO_READ_TIMEOUT: float = Field(30.0, env="MINIO_READ_TIMEOUT")
     DELTA_LAKEHOUSE_BUCKET: str = Field("delta-lakehouse", env="DELTA_LAKEHOUSE_BUCKET")
     
     # OpenRouter Configuration
@@ -30,24 +33,61 @@ class Settings(BaseSettings):
     EVAL_DB_PATH: str = Field("data/evaluations.db", env="EVAL_DB_PATH")
     CANDIDATE_EXPERIENCE_YEARS: str = Field("8 Years", env="CANDIDATE_EXPERIENCE_YEARS")
     BATCH_EVAL_WORKERS: int = Field(5, env="BATCH_EVAL_WORKERS")
+    APP_SYNC_WORKERS: int = Field(8, env="APP_SYNC_WORKERS")
+    RESUME_PARSE_CONCURRENCY: int = Field(2, env="RESUME_PARSE_CONCURRENCY")
+    LLM_WORKERS: int = Field(8, env="LLM_WORKERS")
+    API_THREADPOOL_SIZE: int = Field(80, env="API_THREADPOOL_SIZE")
+    MASTER_RESUME_PATH: str = Field("/Users/abhijithm/Documents/Code/TailorAI/test/master_resume.json", env="MASTER_RESUME_PATH")
+    RESUME_UPLOAD_DIR: str = Field("/Users/abhijithm/Documents/Code/TailorAI/uploads", env="RESUME_UPLOAD_DIR")
     
     # Supabase Configuration
     SUPABASE_URL: str = Field(default="", env="SUPABASE_URL")
     SUPABASE_SERVICE_KEY: str = Field(default="", env="SUPABASE_SERVICE_KEY")
     USE_SUPABASE: bool = Field(default=False, env="USE_SUPABASE")
+    SUPABASE_MAX_CONNECTIONS: int = Field(default=40, env="SUPABASE_MAX_CONNECTIONS")
+    SUPABASE_MAX_KEEPALIVE: int = Field(default=20, env="SUPABASE_MAX_KEEPALIVE")
+    # Direct Postgres connection string (Supabase "Connection string" URI); optional
+    SUPABASE_DB_URL: str = Field(default="", env="SUPABASE_DB_URL")
     
     # Langfuse Configuration
     LANGFUSE_PUBLIC_KEY: str = Field(default="", env="LANGFUSE_PUBLIC_KEY")
     LANGFUSE_SECRET_KEY: str = Field(default="", env="LANGFUSE_SECRET_KEY")
     LANGFUSE_BASE_URL: str = Field(default="http://127.0.0.1:3010", env="LANGFUSE_BASE_URL")
     
+    def delta_storage_options(self) -> dict:
+        """S3 storage options for the Delta Lake tables on MinIO."""
+        return {
+            "AWS_ENDPOINT_URL": f"http://{self.MINIO_ENDPOINT}",
+            "AWS_ACCESS_KEY_ID": self.MINIO_ACCESS_KEY,
+            "AWS_SECRET_ACCESS_KEY": self.MINIO_SECRET_KEY,
+            "AWS_REGION": "us-east-1",
+            "AWS_ALLOW_HTTP": "true",
+            # MinIO has no atomic rename-if-not-exists; writers are single-process
+            "AWS_S3_ALLOW_UNSAFE_RENAME": "true",
+            # Fail fast on an unreachable MinIO instead of the client's long defaults
+            "connect_timeout": f"{int(self.MINIO_CONNECT_TIMEOUT * 1000)}ms",
+            "timeout": f"{int(self.MINIO_READ_TIMEOUT * 1000)}ms",
+        }
+    
+    @cached_property
+    def openrouter_chat_url(self) -> str:
+        """Full OpenRouter chat completions endpoint, whether or not the base URL includes it."""
+        base = self.OPENROUTER_BASE_URL
+        return base if base.endswith("/chat/completions") else f"{base}/chat/completions"
+    
     model_config = {
         "env_file": str(ENV_FILE),
         "env_file_encoding": "utf-8",
         "extra": "ignore"
     }
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide Settings instance (.env is parsed once)."""
+    return Settings()
+
+
+settings = get_settings()
 
 
 
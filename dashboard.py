@@ -4,6 +4,7 @@ TailorAI Lakehouse Dashboard
 A lightweight Streamlit dashboard to visualize job data from the Gold Delta table.
 Run with: streamlit run dashboard.py
 """
+import altair as alt
 import streamlit as st
 import polars as pl
 from deltalake import DeltaTable
@@ -20,25 +21,140 @@ st.set_page_config(
 )
 
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def load_gold_data() -> pl.DataFrame:
-    """Load data from Gold Delta table."""
-    storage_options = {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-    }
+@st.cache_resource
+def get_gold_table() -> DeltaTable:
+    """Open the Gold Delta table once per Streamlit server process."""
+    storage_options = settings.delta_storage_options()
     
     gold_path = f"s3://{settings.DELTA_LAKEHOUSE_BUCKET}/gold/jobs"
+    return DeltaTable(gold_path, storage_options=storage_options)
+
+
+def gold_version() -> int:
+    """Bring the cached Gold table up to its latest commit and return the version.
     
-    try:
-        dt = DeltaTable(gold_path, storage_options=storage_options)
-        return pl.from_arrow(dt.to_pyarrow_table())
-    except Exception as e:
-        st.error(f"Failed to load Gold table: {e}")
-        return pl.DataFrame()
+    Only new _delta_log entries are read. The version is passed to the cached
+    loaders below as part of their key, so they recompute only after a commit.
+    """
+    dt = get_gold_table()
+    dt.update_incremental()
+    return dt.version()
+
+
+def scan_gold_data() -> pl.LazyFrame:
+    """Lazily scan the Gold Delta table."""
+    return pl.scan_delta(get_gold_table())
+
+
+@st.cache_data(max_entries=32)  # keyed on Gold version
+def load_filter_options(version: int) -> dict:
+    """Load sidebar filter values and the total job count from Gold table."""
+    df = scan_gold_data().select("company_name", "location", "seniority_level").collect()
+    
+    return {
+        "total": len(df),
+        "companies": sorted(df["company_name"].drop_nulls().unique().to_list()),
+        "locations": sorted([loc for loc in df["location"].unique().to_list() if loc]),
+        "seniority_levels": sorted([s for s in df["seniority_level"].unique().to_list() if s]),
+    }
+
+
+# Columns shown in the job listing table
+DISPLAY_COLUMNS = [
+    "id", "title", "company_name", "location", 
+    "seniority_level", "employment_type", "posted_at", "applicants_count"
+]
+
+# Columns read from the Gold table (listing plus search and ingestion metadata)
+LOAD_COLUMNS = DISPLAY_COLUMNS + ["description_text", "valid_from"]
+
+
+def filter_gold_data(
+    company: str | None = None,
+    location: str | None = None,
+    seniority: str | None = None,
+) -> pl.LazyFrame:
+    """Lazily scan the Gold table with the sidebar filters applied.
+    
+    Filters are applied to the lazy scan so Delta file statistics can skip
+    files that cannot match instead of reading the whole table.
+    """
+    lf = scan_gold_data()
+    lf = lf.select([c for c in LOAD_COLUMNS if c in lf.collect_schema().names()])
+    if company:
+        lf = lf.filter(pl.col("company_name") == company)
+    if location:
+        lf = lf.filter(pl.col("location") == location)
+    if seniority:
+        lf = lf.filter(pl.col("seniority_level") == seniority)
+    return lf
+
+
+@st.cache_data(max_entries=32)  # keyed on Gold version + filters
+def load_gold_data(
+    version: int,
+    company: str | None = None,
+    location: str | None = None,
+    seniority: str | None = None,
+) -> pl.DataFrame:
+    """Load filtered data from Gold Delta table."""
+    return filter_gold_data(company, location, seniority).collect()
+
+
+@st.cache_data(max_entries=32)  # keyed on Gold version + filters
+def load_job_stats(
+    version: int,
+    company: str | None = None,
+    location: str | None = None,
+    seniority: str | None = None,
+) -> dict:
+    """Compute metric card and chart aggregates from Gold Delta table.
+    
+    Aggregations run inside the lazy plan, so only the per-company and
+    per-seniority counts are materialised rather than the filtered rows.
+    """
+    lf = filter_gold_data(company, location, seniority)
+    
+    last_ingestion = (
+        pl.col("valid_from").max()
+        if "valid_from" in lf.collect_schema().names()
+        else pl.lit(None)
+    )
+    totals = lf.select(
+        pl.len().alias("total"),
+        pl.col("company_name").n_unique().alias("unique_companies"),
+        last_ingestion.alias("last_ingestion"),
+    )
+    top_companies = (
+        lf.group_by("company_name")
+        .len()
+        .top_k(10, by="len")
+        .rename({"len": "count"})
+    )
+    seniority_counts = (
+        lf.filter(pl.col("seniority_level").is_not_null())
+        .group_by("seniority_level")
+        .len()
+        .rename({"len": "count"})
+    )
+    
+    totals, top_companies, seniority_counts = pl.collect_all(
+        [totals, top_companies, seniority_counts]
+    )
+    
+    return {
+        **totals.row(0, named=True),
+        "top_companies": top_companies,
+        "seniority_counts": seniority_counts,
+    }
+
+
+def bar_chart(counts: pl.DataFrame, category: str) -> alt.Chart:
+    """Bar chart of a count column, drawn straight from the Polars frame (no pandas copy)."""
+    return alt.Chart(counts).mark_bar().encode(
+        x=alt.X(f"{category}:N", sort="-y"),
+        y="count:Q",
+    )
 
 
 def main():
@@ -46,10 +162,17 @@ def main():
     st.title("📊 TailorAI Lakehouse Dashboard")
     st.markdown("*Visualizing job data from the Delta Lake Gold layer*")
     
-    # Load data
-    df = load_gold_data()
+    # Load data (cached per Gold table version). Loaders raise on failure and
+    # Streamlit does not cache exceptions, so a transient error is retried on
+    # the next rerun instead of being cached until the next Gold commit
+    try:
+        version = gold_version()
+        options = load_filter_options(version)
+    except Exception as e:
+        st.error(f"Failed to load Gold table: {e}")
+        return
     
-    if df.is_empty():
+    if not options["total"]:
         st.warning("No data available. Run the lakehouse pipeline first.")
         st.code("python3 -m lakehouse.bronze\npython3 -m lakehouse.silver\npython3 -m lakehouse.gold")
         return
@@ -58,61 +181,52 @@ def main():
     st.sidebar.header("🔍 Filters")
     
     # Company filter
-    companies = ["All"] + sorted(df["company_name"].unique().to_list())
+    companies = ["All"] + options["companies"]
     selected_company = st.sidebar.selectbox("Company", companies)
     
     # Location filter
-    locations = ["All"] + sorted([loc for loc in df["location"].unique().to_list() if loc])
+    locations = ["All"] + options["locations"]
     selected_location = st.sidebar.selectbox("Location", locations)
     
     # Seniority filter
-    seniority_levels = ["All"] + sorted([s for s in df["seniority_level"].unique().to_list() if s])
+    seniority_levels = ["All"] + options["seniority_levels"]
     selected_seniority = st.sidebar.selectbox("Seniority Level", seniority_levels)
     
-    # Apply filters
-    filtered_df = df
-    if selected_company != "All":
-        filtered_df = filtered_df.filter(pl.col("company_name") == selected_company)
-    if selected_location != "All":
-        filtered_df = filtered_df.filter(pl.col("location") == selected_location)
-    if selected_seniority != "All":
-        filtered_df = filtered_df.filter(pl.col("seniority_level") == selected_seniority)
+    # Apply filters (pushed down into the Delta scan)
+    filters = {
+        "company": None if selected_company == "All" else selected_company,
+        "location": None if selected_location == "All" else selected_location,
+        "seniority": None if selected_seniority == "All" else selected_seniority,
+    }
+    try:
+        stats = load_job_stats(version, **filters)
+        filtered_df = load_gold_data(version, **filters)
+    except Exception as e:
+        st.error(f"Failed to load Gold table: {e}")
+        return
     
     # Metric cards
     st.markdown("---")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("📋 Total Jobs", len(filtered_df))
+        st.metric("📋 Total Jobs", stats["total"])
     
     with col2:
-        st.metric("🏢 Unique Companies", filtered_df["company_name"].n_unique())
+        st.metric("🏢 Unique Companies", stats.get("unique_companies", 0))
     
     with col3:
-        # Top poster
-        if not filtered_df.is_empty():
-            top_company = (
-                filtered_df
-                .group_by("company_name")
-                .len()
-                .sort("len", descending=True)
-                .head(1)
-            )
-            if top_company.height > 0:
-                st.metric("🏆 Top Poster", top_company["company_name"][0])
-            else:
-                st.metric("🏆 Top Poster", "-")
+        # Top poster (top_k output is sorted by count)
+        if stats["total"] and stats["top_companies"].height > 0:
+            st.metric("🏆 Top Poster", stats["top_companies"]["company_name"][0])
         else:
             st.metric("🏆 Top Poster", "-")
     
     with col4:
         # Last ingestion date
-        if not filtered_df.is_empty() and "valid_from" in filtered_df.columns:
-            last_date = filtered_df["valid_from"].max()
-            if last_date:
-                st.metric("📅 Last Ingestion", last_date.strftime("%Y-%m-%d"))
-            else:
-                st.metric("📅 Last Ingestion", "-")
+        last_date = stats.get("last_ingestion")
+        if last_date:
+            st.metric("📅 Last Ingestion", last_date.strftime("%Y-%m-%d"))
         else:
             st.metric("📅 Last Ingestion", "-")
     
@@ -122,31 +236,18 @@ def main():
     
     with chart_col1:
         st.subheader("📊 Jobs by Company (Top 10)")
-        if not filtered_df.is_empty():
-            company_counts = (
-                filtered_df
-                .group_by("company_name")
-                .len()
-                .sort("len", descending=True)
-                .head(10)
-                .rename({"len": "count"})
-            )
-            st.bar_chart(company_counts.to_pandas().set_index("company_name"))
+        if stats["total"]:
+            company_counts = stats["top_companies"]
+            st.altair_chart(bar_chart(company_counts, "company_name"), use_container_width=True)
         else:
             st.info("No data to display")
     
     with chart_col2:
         st.subheader("🎯 Jobs by Seniority Level")
-        if not filtered_df.is_empty():
-            seniority_counts = (
-                filtered_df
-                .filter(pl.col("seniority_level").is_not_null())
-                .group_by("seniority_level")
-                .len()
-                .rename({"len": "count"})
-            )
+        if stats["total"]:
+            seniority_counts = stats["seniority_counts"]
             if seniority_counts.height > 0:
-                st.bar_chart(seniority_counts.to_pandas().set_index("seniority_level"))
+                st.altair_chart(bar_chart(seniority_counts, "seniority_level"), use_container_width=True)
             else:
                 st.info("No seniority data available")
         else:
@@ -161,17 +262,14 @@ def main():
     
     display_df = filtered_df
     if search_term:
+        # Plain substring match: no regex compile per rerun, and input like "C++" is safe
         display_df = display_df.filter(
-            pl.col("title").str.contains(search_term, literal=False) |
-            pl.col("description_text").str.contains(search_term, literal=False)
+            pl.col("title").str.contains(search_term, literal=True) |
+            pl.col("description_text").str.contains(search_term, literal=True)
         )
     
     # Select columns to display
-    display_columns = [
-        "id", "title", "company_name", "location", 
-        "seniority_level", "employment_type", "posted_at", "applicants_count"
-    ]
-    available_columns = [c for c in display_columns if c in display_df.columns]
+    available_columns = [c for c in DISPLAY_COLUMNS if c in display_df.columns]
     
     if not display_df.is_empty():
         st.dataframe(
@@ -179,7 +277,7 @@ def main():
             use_container_width=True,
             hide_index=True,
         )
-        st.caption(f"Showing {len(display_df)} of {len(df)} total jobs")
+        st.caption(f"Showing {len(display_df)} of {options['total']} total jobs")
     else:
         st.info("No jobs match your filters")
     
@@ -1,7 +1,17 @@
 
+from functools import lru_cache
+
 import duckdb
 from backend.settings import settings
 
+# Installed/loaded state of an extension in the current connection
+EXTENSION_STATE_SQL = "SELECT installed, loaded FROM duckdb_extensions() WHERE extension_name = ?"
+
+def _sql_literal(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
 class ValidationEngine:
     def __init__(self):
         """Initialize DuckDB engine with S3 and Postgres capabilities."""
@@ -13,27 +23,54 @@ class ValidationEngine:
     def _setup_extensions(self):
         """Install and load necessary extensions."""
         # httpfs for S3 access
-        self.conn.install_extension("httpfs")
-        self.conn.load_extension("httpfs")
+        self._ensure_extension("httpfs")
         # postgres for direct DB query
-        self.conn.install_extension("postgres")
-        self.conn.load_extension("postgres")
+        self._ensure_extension("postgres")
+
+    def _ensure_extension(self, name: str):
+        """Install and load an extension, skipping steps that are already done."""
+        row = self.conn.execute(EXTENSION_STATE_SQL, [name]).fetchone()
+        installed, loaded = row if row else (False, False)
+        if loaded:
+            return
+        if not installed:
+            self.conn.install_extension(name)
+        self.conn.load_extension(name)
 
     def _configure_s3(self):
         """Configure S3 credentials for MinIO access."""
-        # DuckDB requires specific s3 config
+        # DuckDB does not accept bound parameters in SET/CREATE SECRET, so values
+        # are quoted as SQL literals; a single secret replaces five SET statements
         self.conn.execute(f"""
-            SET s3_endpoint='{settings.MINIO_ENDPOINT}';
-            SET s3_access_key_id='{settings.MINIO_ACCESS_KEY}';
-            SET s3_secret_access_key='{settings.MINIO_SECRET_KEY}';
-            SET s3_use_ssl='false';
-            SET s3_url_style='path';
+            CREATE OR REPLACE SECRET minio (
+                TYPE s3,
+                ENDPOINT {_sql_literal(settings.MINIO_ENDPOINT)},
+                KEY_ID {_sql_literal(settings.MINIO_ACCESS_KEY)},
+                SECRET {_sql_literal(settings.MINIO_SECRET_KEY)},
+                USE_SSL false,
+                URL_STYLE 'path'
+            )
         """)
 
     def load_app_table(self, table_name: str, alias: str = None):
         """Load an Application Database table into DuckDB (as alias)."""
         target_name = alias or table_name
         
+        if settings.USE_SUPABASE and settings.SUPABASE_DB_URL:
+            # Direct approach: scan Postgres through the postgres extension, so
+            # projections and filters are pushed down instead of pulling every row
+            try:
+                self.conn.execute(
+                    f"ATTACH IF NOT EXISTS {_sql_literal(settings.SUPABASE_DB_URL)} AS app_pg (TYPE POSTGRES, READ_ONLY)"
+                )
+                self.conn.execute(f"CREATE OR REPLACE VIEW {target_name} AS SELECT * FROM app_pg.public.{table_name}")
+                print(f"Attached Supabase table '{table_name}' as '{target_name}' via Postgres")
+                return
+            except Exception as e:
+                print(f"Error attaching Supabase Postgres: {e}. Falling back to the API.")
+                # Drop any view left from an earlier call so the API table is not shadowed
+                self.conn.execute(f"DROP VIEW IF EXISTS {target_name}")
+
         if settings.USE_SUPABASE:
             # Hybrid approach: Fetch data via API -> Arrow -> DuckDB
             try:
@@ -59,8 +96,7 @@ class ValidationEngine:
             db_path = settings.EVAL_DB_PATH
             try:
                 # Install sqlite extension if not present - duckdb usually builds it in
-                self.conn.install_extension("sqlite") 
-                self.conn.load_extension("sqlite")
+                self._ensure_extension("sqlite")
                 
                 # Attach ONLY once
                 try:
@@ -86,8 +122,7 @@ class ValidationEngine:
         # Using parquet glob as fallback (works for non-transactional reads of latest state often)
         # But 'delta_scan' is safer.
         try:
-             self.conn.install_extension("delta")
-             self.conn.load_extension("delta")
+             self._ensure_extension("delta")
              self.conn.execute(f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM delta_scan('{s3_path}')")
         except Exception as e:
              print(f"Delta extension warning: {e}. Fallback to parquet glob (risky for transactional tables).")
@@ -97,3 +132,9 @@ class ValidationEngine:
     def query(self, sql: str):
         """Execute a SQL query and return a Polars DataFrame."""
         return self.conn.sql(sql).pl()
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> ValidationEngine:
+    """Get the process-wide ValidationEngine (extensions and S3 secret set up once)."""
+    return ValidationEngine()
@@ -39,10 +39,11 @@ class DataValidator:
         
         target_app_col = app_id_col or id_col
         
+        # Anti join lets DuckDB stop once 5 examples are found instead of
+        # materialising both sides of an EXCEPT
         query = f"""
-        SELECT {id_col} FROM {gold_table}
-        EXCEPT
-        SELECT {target_app_col} FROM {app_table}
+        SELECT DISTINCT g.{id_col} FROM {gold_table} g
+        ANTI JOIN {app_table} a ON g.{id_col} = a.{target_app_col}
         LIMIT 5
         """
         
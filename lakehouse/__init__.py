@@ -7,8 +7,21 @@ Medallion architecture for job data:
 - Gold: OBT for dashboards and LLM
 """
 
-from .bronze import ingest_to_bronze
-from .silver import transform_to_silver
-from .gold import create_gold_table
+import importlib
 
 __all__ = ["ingest_to_bronze", "transform_to_silver", "create_gold_table"]
+
+# Layer modules pull in polars/deltalake/pyarrow, so they are imported on
+# first attribute access rather than whenever the package is imported
+_LAZY_ATTRS = {
+    "ingest_to_bronze": ".bronze",
+    "transform_to_silver": ".silver",
+    "create_gold_table": ".gold",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -1,14 +1,13 @@
 import sys
 import logging
-from datetime import datetime, date
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import polars as pl
-from deltalake import DeltaTable
 
 # Import settings - assuming running from project root context or path is set up
 try:
     from backend.settings import settings
     from agents.supabase_client import get_supabase_client
-    from services.job_mapper import map_job_record
+    from services.job_mapper import SOURCE_COLUMNS, map_job_frame
     from backend.logging import setup_logging
 except ImportError:
     # Fallback for standalone script execution if needed
@@ -17,31 +16,20 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from backend.settings import settings
     from agents.supabase_client import get_supabase_client
-    from services.job_mapper import map_job_record
+    from services.job_mapper import SOURCE_COLUMNS, map_job_frame
     from backend.logging import setup_logging
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 100
+IGNORED_IDS_PAGE_SIZE = 1000
+PROGRESS_EVERY = 500
 
-def get_storage_options() -> dict:
-    """Get S3 storage options for Delta Lake."""
-    return {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-    }
-
-def clean_value(val):
-    """Clean value for JSON serialization."""
-    if val is None:
-        return None
-    if isinstance(val, (date, datetime)):
-        return val.isoformat()
-    return val
+def _upsert_batch(client, batch: list[dict]) -> int:
+    """Upsert one batch of job records and return its size."""
+    client.table("jobs").upsert(batch, on_conflict="id").execute()
+    return len(batch)
 
 def sync_silver_to_app():
     logger.info("Starting Sync: Silver Jobs -> App Database (Upsert)")
@@ -55,9 +43,11 @@ def sync_silver_to_app():
     logger.info(f"Reading Silver table from: {silver_path}")
     
     try:
-        dt = DeltaTable(silver_path, storage_options=get_storage_options())
-        # Filter for current records only
-        df = pl.from_arrow(dt.to_pyarrow_table()).filter(pl.col("is_current") == True)
+        lf = pl.scan_delta(silver_path, storage_options=settings.delta_storage_options())
+        # Filter for current records only; the predicate and projection are pushed
+        # into the Delta scan, so historical rows and unused columns are never read
+        columns = [c for c in SOURCE_COLUMNS if c in lf.collect_schema().names()]
+        df = lf.filter(pl.col("is_current")).select(columns).collect(engine="streaming")
     except Exception as e:
         logger.critical(f"Failed to load Silver table: {e}", exc_info=True)
         return
@@ -74,10 +64,22 @@ def sync_silver_to_app():
     try:
         # Fetch IDs where status is NOT active
         # Supabase filtering: status.neq.active
-        # Page through if necessary, but for now assuming < 100k deleted jobs fits in mem or simple query
-        res = client.table("jobs").select("id").neq("status", "active").execute()
-        if res.data:
-            ignored_ids = {r["id"] for r in res.data}
+        # Paged, since PostgREST caps each response (1000 rows by default)
+        offset = 0
+        while True:
+            res = (
+                client.table("jobs")
+                .select("id")
+                .neq("status", "active")
+                .order("id")
+                .range(offset, offset + IGNORED_IDS_PAGE_SIZE - 1)
+                .execute()
+            )
+            ignored_ids.update(r["id"] for r in res.data)
+            if len(res.data) < IGNORED_IDS_PAGE_SIZE:
+                break
+            offset += IGNORED_IDS_PAGE_SIZE
+        if ignored_ids:
             logger.info(f"Found {len(ignored_ids)} ignored (deleted/archived) jobs.")
     except Exception as e:
         logger.warning(f"Could not fetch deleted jobs: {e}")
@@ -85,48 +87,42 @@ def sync_silver_to_app():
     # 3. Process in Batches
     processed = 0
     errors = 0
-    skipped = 0
     
-    # Convert to Python dicts for easier iteration
-    rows = df.iter_rows(named=True)
+    # Drop ignored jobs with a hashed anti-join before any rows are converted to Python
+    if ignored_ids:
+        ignored_df = pl.DataFrame({"id": list(ignored_ids)}, schema={"id": pl.Utf8})
+        df = df.with_columns(pl.col("id").cast(pl.Utf8)).join(ignored_df, on="id", how="anti")
+    skipped = total_rows - len(df)
     
-    batch = []
+    # Map Columns (Enhanced Schema using Shared Mapper) in one vectorized projection
+    df = map_job_frame(df)
     
-    for row in rows:
-        job_id = str(row.get("id"))
-        
-        # SKIP if in ignored list
-        if job_id in ignored_ids:
-            skipped += 1
-            continue
-
-        # Map Columns (Enhanced Schema using Shared Mapper)
-        record = map_job_record(row) 
-        
-        batch.append(record)
-        
-        if len(batch) >= BATCH_SIZE:
+    def handle_done(done):
+        nonlocal processed, errors
+        for future in done:
             try:
-                # Upsert
-                client.table("jobs").upsert(batch, on_conflict="id").execute()
-                processed += len(batch)
-                # Use debug for per-batch progress to avoid log spam, or info with \r logic if running interactive
-                # Since this is likely background, debug or periodic info is better.
-                if processed % 500 == 0:
+                synced = future.result()
+                processed += synced
+                # Periodic progress line every PROGRESS_EVERY rows, not per batch; checks
+                # for a crossed boundary since failed batches shift the running total
+                if processed // PROGRESS_EVERY > (processed - synced) // PROGRESS_EVERY:
                      logger.info(f"Synced {processed}/{total_rows} records. Skipped: {skipped}")
-                batch = []
             except Exception as e:
                 logger.error(f"Error syncing batch: {e}", exc_info=True)
                 errors += 1
-                batch = []
-                
-    # Final batch
-    if batch:
-        try:
-            client.table("jobs").upsert(batch, on_conflict="id").execute()
-            processed += len(batch)
-        except Exception as e:
-            logger.error(f"Error syncing final batch: {e}", exc_info=True)
-            errors += 1
+    
+    # Upserts are network-bound, so several batches are kept in flight; the
+    # pending window is bounded so only a few batches of dicts exist at once
+    max_pending = settings.APP_SYNC_WORKERS * 2
+    with ThreadPoolExecutor(max_workers=settings.APP_SYNC_WORKERS) as executor:
+        pending = set()
+        # Convert to Python dicts one batch at a time
+        for batch_df in df.iter_slices(n_rows=BATCH_SIZE):
+            batch = batch_df.to_dicts()
+            pending.add(executor.submit(_upsert_batch, client, batch))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                handle_done(done)
+        handle_done(wait(pending).done)
 
     logger.info(f"App DB Sync Complete! Processed: {processed}, Skipped: {skipped}, Errors: {errors}")
@@ -27,18 +27,6 @@ def get_minio_client() -> Minio:
     )
 
 
-def get_storage_options() -> dict:
-    """Get S3 storage options for Delta Lake."""
-    return {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-        "AWS_S3_ALLOW_UNSAFE_RENAME": "true",
-    }
-
-
 def list_json_files(client: Minio, bucket: str, prefix: str = "") -> list[str]:
     """List all JSON files in the bucket."""
     objects = client.list_objects(bucket, prefix=prefix, recursive=True)
@@ -62,7 +50,7 @@ def ingest_to_bronze(source_file: str | None = None):
         source_file: Optional specific file to ingest. If None, ingests all files.
     """
     client = get_minio_client()
-    storage_options = get_storage_options()
+    storage_options = settings.delta_storage_options()
     
     # Ensure delta-lakehouse bucket exists
     if not client.bucket_exists(settings.DELTA_LAKEHOUSE_BUCKET):
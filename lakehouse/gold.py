@@ -16,21 +16,9 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 
-def get_storage_options() -> dict:
-    """Get S3 storage options for Delta Lake."""
-    return {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-        "AWS_S3_ALLOW_UNSAFE_RENAME": "true",
-    }
-
-
 def read_silver_table() -> pl.DataFrame:
     """Read the Silver Delta table."""
-    storage_options = get_storage_options()
+    storage_options = settings.delta_storage_options()
     silver_path = f"s3://{settings.DELTA_LAKEHOUSE_BUCKET}/silver/jobs"
     
     dt = DeltaTable(silver_path, storage_options=storage_options)
@@ -44,7 +32,7 @@ def create_gold_table():
     Gold table contains only current records (is_current = true)
     and all columns needed for dashboards and LLM consumption.
     """
-    storage_options = get_storage_options()
+    storage_options = settings.delta_storage_options()
     
     logger.info("Reading Silver table...")
     try:
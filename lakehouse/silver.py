@@ -17,18 +17,6 @@ sys.path.insert(0, '..')
 from backend.settings import settings
 
 
-def get_storage_options() -> dict:
-    """Get S3 storage options for Delta Lake."""
-    return {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-        "AWS_S3_ALLOW_UNSAFE_RENAME": "true",
-    }
-
-
 def parse_raw_json(raw_json: str) -> dict:
     """Parse raw JSON string and extract/flatten fields."""
     job = json.loads(raw_json)
@@ -92,7 +80,7 @@ def parse_raw_json(raw_json: str) -> dict:
 
 def read_bronze_table() -> pl.DataFrame:
     """Read the Bronze Delta table."""
-    storage_options = get_storage_options()
+    storage_options = settings.delta_storage_options()
     bronze_path = f"s3://{settings.DELTA_LAKEHOUSE_BUCKET}/bronze/jobs"
     
     dt = DeltaTable(bronze_path, storage_options=storage_options)
@@ -101,7 +89,7 @@ def read_bronze_table() -> pl.DataFrame:
 
 def read_silver_table() -> pl.DataFrame | None:
     """Read existing Silver table, or return None if doesn't exist."""
-    storage_options = get_storage_options()
+    storage_options = settings.delta_storage_options()
     silver_path = f"s3://{settings.DELTA_LAKEHOUSE_BUCKET}/silver/jobs"
     
     try:
@@ -120,7 +108,7 @@ def transform_to_silver():
     - valid_to: when this version was superseded (null if current)
     - is_current: boolean flag for easy filtering
     """
-    storage_options = get_storage_options()
+    storage_options = settings.delta_storage_options()
     
     print("Reading Bronze table...")
     bronze_df = read_bronze_table()
@@ -27,7 +27,6 @@ def delete_record():
             print("Successfully deleted record from SQLite.")
         else:
             print("Record not found in SQLite.")
-        conn.close()
 
 if __name__ == "__main__":
     delete_record()
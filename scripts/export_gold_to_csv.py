@@ -18,17 +18,6 @@ sys.path.append(str(Path(__file__).parent.parent))
 from backend.settings import settings
 
 
-def get_storage_options() -> dict:
-    """Get MinIO/S3 storage options."""
-    return {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-    }
-
-
 def main():
     print("--- Exporting Gold Table to CSV ---")
     
@@ -41,7 +30,7 @@ def main():
     
     try:
         # 2. Connect to Delta Table
-        storage_options = get_storage_options()
+        storage_options = settings.delta_storage_options()
         dt = DeltaTable(gold_path, storage_options=storage_options)
         
         # 3. Load into Polars
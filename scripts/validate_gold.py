@@ -5,13 +5,13 @@ from pathlib import Path
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from data_validation.engine import ValidationEngine
+from data_validation.engine import get_engine
 from data_validation.validators import DataValidator
 from backend.settings import settings
 
 def main():
     print("Initializing DuckDB Validation Engine...")
-    engine = ValidationEngine()
+    engine = get_engine()
     validator = DataValidator(engine)
     
     # 1. Register Gold Table (MinIO)
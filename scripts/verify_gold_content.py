@@ -4,13 +4,7 @@ from deltalake import DeltaTable
 from backend.settings import settings
 
 def check_gold_data():
-    storage_options = {
-        "AWS_ENDPOINT_URL": f"http://{settings.MINIO_ENDPOINT}",
-        "AWS_ACCESS_KEY_ID": settings.MINIO_ACCESS_KEY,
-        "AWS_SECRET_ACCESS_KEY": settings.MINIO_SECRET_KEY,
-        "AWS_REGION": "us-east-1",
-        "AWS_ALLOW_HTTP": "true",
-    }
+    storage_options = settings.delta_storage_options()
     
     gold_path = f"s3://{settings.DELTA_LAKEHOUSE_BUCKET}/gold/jobs"
     
@@ -1,6 +1,35 @@
 from datetime import date, datetime
 from typing import Any, Dict, Optional
 
+import polars as pl
+
+# Supabase 'jobs' columns in output order: the single field spec both mappers
+# follow. Each column is copied from the same-named Silver field unless it is
+# listed in DERIVED_COLUMNS.
+JOB_COLUMNS = (
+    "id", "company_name", "title", "location", "description_text",
+    "job_url", "posted_at", "seniority_level", "employment_type",
+    "applicants_count", "company_website",
+    "job_function", "industries", "salary_info", "salary_min", "salary_max", "benefits",
+    "company_linkedin_url", "company_logo", "company_description", "company_slogan",
+    "company_employees_count", "company_city", "company_state", "company_country",
+    "company_postal_code", "company_street_address",
+    "job_poster_name", "job_poster_title", "job_poster_profile_url",
+    "apply_url", "input_url",
+    "status", "updated_at",
+)
+
+# Columns computed by the mappers instead of copied
+DERIVED_COLUMNS = frozenset({
+    "id", "job_url", "posted_at", "salary_min", "salary_max", "status", "updated_at",
+})
+
+# Source fields read by the mappers (Silver column names); 'link' feeds job_url
+SOURCE_COLUMNS = (
+    "id", "link", "job_url", "posted_at",
+    *(c for c in JOB_COLUMNS if c not in DERIVED_COLUMNS),
+)
+
 def clean_value(val: Any) -> Any:
     """Clean value for JSON serialization."""
     if val is None:
@@ -21,47 +50,63 @@ def map_job_record(source_data: Dict[str, Any], is_active: bool = True) -> Dict[
         Dictionary matching Supabase 'jobs' table columns.
     """
     # Defensive .get in case source keys vary slightly
-    
-    return {
+    derived = {
         "id": str(source_data.get("id")),
-        "company_name": source_data.get("company_name"),
-        "title": source_data.get("title"),
-        "location": source_data.get("location"),
-        "description_text": source_data.get("description_text"),
         # Prefer 'link' (Silver) or 'job_url'
         "job_url": source_data.get("link") or source_data.get("job_url"),
         "posted_at": clean_value(source_data.get("posted_at")),
-        "seniority_level": source_data.get("seniority_level"),
-        "employment_type": source_data.get("employment_type"),
-        "applicants_count": source_data.get("applicants_count"),
-        "company_website": source_data.get("company_website"),
-        
-        # New Fields
-        "job_function": source_data.get("job_function"), # JSON
-        "industries": source_data.get("industries"), # JSON
-        "salary_info": source_data.get("salary_info"),
         "salary_min": None,
         "salary_max": None,
-        "benefits": source_data.get("benefits"), # JSON
-        
-        "company_linkedin_url": source_data.get("company_linkedin_url"),
-        "company_logo": source_data.get("company_logo"),
-        "company_description": source_data.get("company_description"),
-        "company_slogan": source_data.get("company_slogan"),
-        "company_employees_count": source_data.get("company_employees_count"),
-        "company_city": source_data.get("company_city"),
-        "company_state": source_data.get("company_state"),
-        "company_country": source_data.get("company_country"),
-        "company_postal_code": source_data.get("company_postal_code"),
-        "company_street_address": source_data.get("company_street_address"),
-        
-        "job_poster_name": source_data.get("job_poster_name"),
-        "job_poster_title": source_data.get("job_poster_title"),
-        "job_poster_profile_url": source_data.get("job_poster_profile_url"),
-        
-        "apply_url": source_data.get("apply_url"),
-        "input_url": source_data.get("input_url"),
-        
         "status": "active" if is_active else "archived", 
-        "updated_at": datetime.now().isoformat() 
+        "updated_at": datetime.now().isoformat(),
+    }
+    return {
+        column: derived[column] if column in DERIVED_COLUMNS else source_data.get(column)
+        for column in JOB_COLUMNS
+    }
+
+
+def map_job_frame(df: pl.DataFrame, is_active: bool = True) -> pl.DataFrame:
+    """
+    Vectorized map_job_record: map a Silver DataFrame to the Supabase 'jobs' columns.
+    
+    Produces the same columns, in the same order, as map_job_record so that
+    to_dicts() on the result yields ready-to-upsert records.
+    """
+    names = set(df.columns)
+    
+    def col(name: str) -> pl.Expr:
+        # Missing source columns map to nulls, like .get() does per row
+        return pl.col(name) if name in names else pl.lit(None)
+    
+    # Same strings as date/datetime.isoformat() in clean_value
+    posted_at = col("posted_at")
+    dtype = df.schema.get("posted_at")
+    if dtype == pl.Date:
+        posted_at = posted_at.dt.strftime("%Y-%m-%d")
+    elif isinstance(dtype, pl.Datetime):
+        fmt = "%Y-%m-%dT%H:%M:%S"
+        tz = "%:z" if dtype.time_zone else ""
+        posted_at = (
+            pl.when(posted_at.dt.microsecond() == 0)
+            .then(posted_at.dt.strftime(fmt + tz))
+            .otherwise(posted_at.dt.strftime(fmt + ".%6f" + tz))
+        )
+    
+    # Prefer 'link' (Silver) or 'job_url', treating empty strings as missing
+    link = col("link")
+    job_url = pl.when(link.is_not_null() & (link.cast(pl.Utf8) != "")).then(link).otherwise(col("job_url"))
+    
+    derived = {
+        "id": col("id").cast(pl.Utf8),
+        "job_url": job_url,
+        "posted_at": posted_at,
+        "salary_min": pl.lit(None),
+        "salary_max": pl.lit(None),
+        "status": pl.lit("active" if is_active else "archived"),
+        "updated_at": pl.lit(datetime.now().isoformat()),
     }
+    return df.select(
+        (derived[column] if column in DERIVED_COLUMNS else col(column)).alias(column)
+        for column in JOB_COLUMNS
+    )
@@ -0,0 +1,93 @@
+"""
+PDF text extraction for uploaded resumes.
+
+MuPDF (PyMuPDF) is the primary extractor, with PDFium as a fallback for
+files MuPDF rejects. The strategy adapts to document size: typical resumes
+are extracted page by page in-process, while long documents are split into
+page ranges and extracted in a process pool.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+import fitz
+import pypdfium2 as pdfium
+
+logger = logging.getLogger(__name__)
+
+# MuPDF text flags: keep ligatures/whitespace, leave out images
+PDF_TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE
+
+# Documents with more pages than this are extracted in the process pool
+PARALLEL_MIN_PAGES = 50
+
+# Pages handled by a single process-pool task
+PAGES_PER_TASK = 25
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Get the shared extraction process pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), max_tasks_per_child=50)
+        return _pool
+
+
+def _join_pages(pages: Iterable[str]) -> str:
+    """Join per-page texts, skipping blank pages."""
+    return "".join(text + "\n\n" for text in pages if text.strip())
+
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> list[str]:
+    """Extract the text of pages [start, stop) with MuPDF (process-pool task)."""
+    with fitz.open(stream=data, filetype="pdf") as pdf:
+        return [pdf[i].get_text("text", flags=PDF_TEXT_FLAGS) for i in range(start, stop)]
+
+
+def _extract_mupdf(data: bytes) -> str:
+    """Extract PDF text with MuPDF, picking a strategy by page count."""
+    with fitz.open(stream=data, filetype="pdf") as pdf:
+        page_count = pdf.page_count
+        if page_count <= PARALLEL_MIN_PAGES:
+            return _join_pages(page.get_text("text", flags=PDF_TEXT_FLAGS) for page in pdf)
+
+    logger.info(f"Extracting {page_count}-page PDF in process pool")
+    pool = _get_pool()
+    futures = [
+        pool.submit(_extract_page_range, data, start, min(start + PAGES_PER_TASK, page_count))
+        for start in range(0, page_count, PAGES_PER_TASK)
+    ]
+    return _join_pages(text for future in futures for text in future.result())
+
+
+def _extract_pdfium(data: bytes) -> str:
+    """Extract PDF text with PDFium."""
+    pdf = pdfium.PdfDocument(data)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return _join_pages(pages)
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """Extract text from every page of a PDF held in memory.
+
+    Returns an empty string when the PDF contains no extractable text.
+    """
+    try:
+        return _extract_mupdf(data)
+    except Exception as e:
+        logger.warning(f"MuPDF extraction failed, falling back to PDFium: {e}")
+        return _extract_pdfium(data)
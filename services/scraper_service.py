@@ -20,21 +20,27 @@ class ScraperService:
         Maps and upserts all found jobs to Supabase.
         Returns a summary of the operation.
         """
-        logger.info(f"Scraping URL: {url}")
+        return cls.scrape_and_import_many([url])
+
+    @classmethod
+    def scrape_and_import_many(cls, urls: List[str]) -> Dict[str, Any]:
+        """
+        Scrape several LinkedIn job/search URLs in a single Apify run.
+        Maps all found jobs and upserts them to Supabase in one request.
+        Returns a summary of the operation.
+        """
+        logger.info(f"Scraping {len(urls)} URL(s): {urls}")
         
         # 1. Scrape via Apify
-        raw_data = cls._run_apify_sync(url)
+        raw_data = cls._run_apify_sync(urls)
         if not raw_data:
             logger.error("Failed to scrape data from Apify via synchronous run")
             raise Exception("Failed to scrape data from Apify.")
             
         logger.info(f"Scrape successful. Found {len(raw_data)} items.")
         
-        # 2. Iterate and Import
-        imported_ids = []
-        first_job_details = None
-        
-        client = get_supabase_client()
+        # 2. Map items (keyed by id: one upsert cannot touch the same row twice)
+        records: Dict[str, Dict[str, Any]] = {}
         
         for job_item in raw_data:
             try:
@@ -51,38 +57,66 @@ class ScraperService:
                 if not job_id:
                     continue
 
-                # Upsert to Supabase
-                client.table("jobs").upsert(app_record, on_conflict="id").execute()
-                imported_ids.append(job_id)
-                
-                if not first_job_details:
-                    first_job_details = {
-                        "id": job_id,
-                        "title": app_record.get("title"),
-                        "company": app_record.get("company_name")
-                    }
+                records[job_id] = app_record
                     
             except Exception as e:
                 logger.error(f"Failed to import a job item: {e}", exc_info=True)
                 continue
 
-        if not imported_ids:
+        if not records:
              logger.warning("No valid jobs imported from scrape result")
              raise Exception("No valid jobs imported from scrape result.")
 
+        # 3. Upsert everything to Supabase in one request (per job if that fails)
+        imported_ids = cls._upsert_records(records)
+        if not imported_ids:
+             logger.warning("No jobs could be saved from scrape result")
+             raise Exception("No jobs could be saved from scrape result.")
+
+        first_record = records[imported_ids[0]]
+        first_job_details = {
+            "id": imported_ids[0],
+            "title": first_record.get("title"),
+            "company": first_record.get("company_name")
+        }
+
         return {
             "count": len(imported_ids),
             "first_job": first_job_details, # For UI to show immediate feedback or select
             "ids": imported_ids,
-            "id": first_job_details["id"] if first_job_details else None, # Backwards compatibility for frontend
+            "id": first_job_details["id"], # Backwards compatibility for frontend
             "status": "imported"
         }
 
+    @staticmethod
+    def _upsert_records(records: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Upsert mapped jobs to Supabase and return the IDs that were saved.
+        A failed batch falls back to one upsert per job, so a single bad
+        record is logged and skipped instead of failing the whole import.
+        """
+        client = get_supabase_client()
+        try:
+            client.table("jobs").upsert(list(records.values()), on_conflict="id").execute()
+            return list(records)
+        except Exception as e:
+            logger.warning(f"Batch upsert of {len(records)} jobs failed, retrying per job: {e}")
+
+        imported_ids = []
+        for job_id, record in records.items():
+            try:
+                client.table("jobs").upsert(record, on_conflict="id").execute()
+                imported_ids.append(job_id)
+            except Exception as e:
+                logger.error(f"Failed to import job {job_id}: {e}", exc_info=True)
+        return imported_ids
+
     @classmethod
-    def _run_apify_sync(cls, url: str) -> List[Dict]:
-        """Run Apify actor synchronously."""
+    def _run_apify_sync(cls, urls: List[str]) -> List[Dict]:
+        """Run Apify actor synchronously over all given URLs."""
         # Mock Mode for Verification
-        if "mock" in url:
+        mock_urls = [url for url in urls if "mock" in url]
+        if mock_urls:
             logger.warning("Running in MOCK MODE for scraper")
             return [{
                 "id": "1234567890",
@@ -104,14 +138,14 @@ class ScraperService:
                 "applyUrl": url,
                 "inputUrl": url,
                 "status": "active"
-            }]
+            } for url in mock_urls]
 
         if not settings.APIFY_TOKEN:
             logger.critical("APIFY_TOKEN not configured")
             raise Exception("APIFY_TOKEN not configured.")
 
         payload = json.dumps({
-            "urls": [url],
+            "urls": urls,
             "scrapeCompany": True,
             "count": 100,
         })
@@ -0,0 +1,13 @@
+-- Jobs annotated with their evaluation status.
+-- Lets the API filter on is_evaluated with a single server-side
+-- semi-/anti-join instead of shipping every evaluated job_id to the client.
+-- job_evaluations.job_id is UNIQUE and indexed, so the join never duplicates rows.
+-- security_invoker makes the view run with the caller's privileges, so the RLS
+-- policies on jobs and job_evaluations still apply (views bypass RLS otherwise).
+CREATE OR REPLACE VIEW jobs_with_eval
+WITH (security_invoker = true) AS
+SELECT
+    j.*,
+    (e.job_id IS NOT NULL) AS is_evaluated
+FROM jobs j
+LEFT JOIN job_evaluations e ON e.job_id = j.id;
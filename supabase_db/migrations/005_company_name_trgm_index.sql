@@ -0,0 +1,7 @@
+-- Trigram index for the company filter.
+-- The API filters with ilike('%company%'); a leading wildcard cannot use the
+-- btree idx_jobs_company, but a pg_trgm GIN index serves (I)LIKE patterns.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_company_trgm
+    ON jobs USING GIN (company_name gin_trgm_ops);
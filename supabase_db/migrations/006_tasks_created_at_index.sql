@@ -0,0 +1,4 @@
+-- Index for the task list.
+-- GET /api/tasks orders by created_at DESC with a LIMIT; with this index the
+-- newest rows are read straight off the index instead of sorting the table.
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at DESC);
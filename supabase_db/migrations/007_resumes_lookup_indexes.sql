@@ -0,0 +1,6 @@
+-- Composite indexes for the resume lookups.
+-- Tailored versions are listed per job newest-first (and the next version is
+-- MAX(version)+1); the master resume is the newest row with status='master'.
+-- Both queries can then be answered from the index without a sort.
+CREATE INDEX IF NOT EXISTS idx_resumes_job_version ON resumes(job_id, version DESC);
+CREATE INDEX IF NOT EXISTS idx_resumes_status_created ON resumes(status, created_at DESC);
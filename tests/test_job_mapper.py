@@ -0,0 +1,41 @@
+"""
+map_job_frame must produce the same records as map_job_record row by row.
+"""
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from services.job_mapper import JOB_COLUMNS, map_job_frame, map_job_record
+
+
+def _without_updated_at(records: list[dict]) -> list[dict]:
+    return [{k: v for k, v in r.items() if k != "updated_at"} for r in records]
+
+
+def _silver_frame(posted_at: list) -> pl.DataFrame:
+    return pl.DataFrame({
+        "id": [1, 2, 3],
+        "title": ["Data Engineer", "Analyst", None],
+        "company_name": ["Acme", None, "Globex"],
+        "link": ["https://example.com/1", "", None],
+        "job_url": ["https://example.com/u1", "https://example.com/u2", None],
+        "posted_at": posted_at,
+        "applicants_count": [10, None, 3],
+        "is_current": [True, True, True],
+    })
+
+
+@pytest.mark.parametrize("posted_at", [
+    [date(2025, 1, 1), None, date(2024, 12, 31)],
+    [datetime(2025, 1, 1, 12, 0), None, datetime(2024, 12, 31, 8, 30, 15, 250)],
+])
+@pytest.mark.parametrize("is_active", [True, False])
+def test_map_job_frame_matches_map_job_record(posted_at, is_active):
+    df = _silver_frame(posted_at)
+
+    expected = [map_job_record(row, is_active=is_active) for row in df.to_dicts()]
+    actual = map_job_frame(df, is_active=is_active).to_dicts()
+
+    assert _without_updated_at(actual) == _without_updated_at(expected)
+    assert all(list(record) == list(JOB_COLUMNS) for record in actual)
@@ -0,0 +1,160 @@
+"""
+In-flight dedupe of resume uploads in api.routes.resumes.
+
+The parser, the LLM call and the resumes table are replaced with fakes, so
+these tests exercise only the sharing and re-save logic.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from api.routes import resumes
+
+PDF = b"%PDF-1.7 same bytes"
+PARSED = {"basics": {"name": "Jane Doe"}, "work": []}
+
+
+class FakeResumes:
+    """Stands in for the resumes table: master rows in insert order."""
+
+    def __init__(self):
+        self.rows: list[tuple[str, dict]] = []
+
+    def save_resume(self, content, name="Master Resume", is_master=False, **kwargs):
+        record_id = f"row-{len(self.rows) + 1}"
+        self.rows.append((record_id, content))
+        return record_id
+
+    def get_master_resume_id(self):
+        return self.rows[-1][0] if self.rows else None
+
+    @property
+    def latest(self) -> dict:
+        return self.rows[-1][1]
+
+
+@pytest.fixture
+def db(monkeypatch, tmp_path):
+    fake = FakeResumes()
+    monkeypatch.setattr(resumes, "save_resume", fake.save_resume)
+    monkeypatch.setattr(resumes, "get_master_resume_id", fake.get_master_resume_id)
+    monkeypatch.setattr(resumes, "extract_pdf_text", lambda data: "resume text")
+    monkeypatch.setattr(resumes, "get_resume_parser_agent", lambda: object())
+    monkeypatch.setattr(resumes, "MASTER_RESUME_PATH", tmp_path / "base_resume.json")
+    monkeypatch.setattr(resumes, "_inflight_parses", {})
+    return fake
+
+
+def _fake_llm(monkeypatch, result=PARSED, gate: asyncio.Event | None = None, fail_first=False):
+    """Patch run_llm; returns the list of calls made."""
+    calls = []
+
+    async def run_llm(func, *args, **kwargs):
+        calls.append(kwargs)
+        if gate is not None:
+            await gate.wait()
+        if fail_first and len(calls) == 1:
+            raise RuntimeError("LLM unavailable")
+        return result
+
+    monkeypatch.setattr(resumes, "run_llm", run_llm)
+    return calls
+
+
+def _upload(db: FakeResumes) -> str:
+    """Insert the 'processing' row upload_resume saves before scheduling the parse."""
+    return db.save_resume({"status": "processing"}, is_master=True)
+
+
+def _block_backup_write(monkeypatch):
+    """Hold the leader in its post-save backup write until released."""
+    started, release = threading.Event(), threading.Event()
+
+    def write_bytes(file_path, data):
+        started.set()
+        release.wait(5)
+
+    monkeypatch.setattr(resumes, "_write_bytes", write_bytes)
+    return started, release
+
+
+async def _wait_for(event: threading.Event):
+    while not event.is_set():
+        await asyncio.sleep(0.01)
+
+
+def test_concurrent_identical_uploads_parse_once(db, monkeypatch):
+    async def scenario():
+        gate = asyncio.Event()
+        calls = _fake_llm(monkeypatch, gate=gate)
+        monkeypatch.setattr(resumes, "_write_bytes", lambda file_path, data: None)
+
+        first = asyncio.create_task(resumes.process_resume_background(PDF, _upload(db)))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(resumes.process_resume_background(PDF, _upload(db)))
+        await asyncio.sleep(0.05)
+        gate.set()
+        await asyncio.gather(first, second)
+        return calls
+
+    calls = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert db.latest == PARSED
+    assert resumes._inflight_parses == {}
+
+
+def test_failed_parse_is_not_left_in_flight(db, monkeypatch):
+    calls = _fake_llm(monkeypatch, fail_first=True)
+    monkeypatch.setattr(resumes, "_write_bytes", lambda file_path, data: None)
+
+    asyncio.run(resumes.process_resume_background(PDF, _upload(db)))
+
+    assert resumes._inflight_parses == {}
+    assert db.latest["status"] == "error"
+
+    # A retry of the same PDF runs a fresh parse instead of reusing the failure
+    asyncio.run(resumes.process_resume_background(PDF, _upload(db)))
+
+    assert len(calls) == 2
+    assert db.latest == PARSED
+
+
+def test_duplicate_upload_after_shared_save_gets_the_result(db, monkeypatch):
+    _fake_llm(monkeypatch)
+    started, release = _block_backup_write(monkeypatch)
+
+    async def scenario():
+        leader = asyncio.create_task(resumes.process_resume_background(PDF, _upload(db)))
+        await _wait_for(started)  # leader has saved PARSED, still in flight
+
+        waiter = asyncio.create_task(resumes.process_resume_background(PDF, _upload(db)))
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(leader, waiter)
+
+    asyncio.run(scenario())
+
+    # The duplicate's "processing" row must not remain the latest master
+    assert db.latest == PARSED
+
+
+def test_duplicate_upload_does_not_clobber_manual_edit(db, monkeypatch):
+    _fake_llm(monkeypatch)
+    started, release = _block_backup_write(monkeypatch)
+    edited = {"basics": {"name": "Jane Q. Doe"}, "work": []}
+
+    async def scenario():
+        leader = asyncio.create_task(resumes.process_resume_background(PDF, _upload(db)))
+        await _wait_for(started)
+
+        waiter = asyncio.create_task(resumes.process_resume_background(PDF, _upload(db)))
+        await asyncio.sleep(0.05)
+        db.save_resume(edited, is_master=True)  # manual edit while the waiter waits
+        release.set()
+        await asyncio.gather(leader, waiter)
+
+    asyncio.run(scenario())
+
+    assert db.latest == edited
@@ -0,0 +1,55 @@
+"""
+get_next_tailored_version on the SQLite backend.
+"""
+import threading
+import uuid
+
+import pytest
+
+from agents import database
+from backend.settings import settings
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch, tmp_path):
+    """Point agents.database at a fresh SQLite file for this test."""
+    monkeypatch.setattr(settings, "USE_SUPABASE", False)
+    monkeypatch.setattr(settings, "EVAL_DB_PATH", str(tmp_path / "evaluations.db"))
+    monkeypatch.setattr(database, "_local", threading.local())
+    database.get_db_path.cache_clear()
+    database.init_database()
+    conn = database.get_db_connection()
+    yield conn
+    conn.close()
+    database.get_db_path.cache_clear()
+
+
+def _insert(conn, job_id: str, version: int | None):
+    conn.execute(
+        "INSERT INTO resumes (id, name, content, status, job_id, version) VALUES (?, ?, ?, ?, ?, ?)",
+        (str(uuid.uuid4()), "Tailored", "{}", "pending", job_id, version),
+    )
+    conn.commit()
+
+
+def test_first_version_is_one(sqlite_db):
+    assert database.get_next_tailored_version("job-1") == 1
+
+
+def test_null_versions_are_ignored(sqlite_db):
+    _insert(sqlite_db, "job-1", None)
+    assert database.get_next_tailored_version("job-1") == 1
+
+    _insert(sqlite_db, "job-1", 2)
+    _insert(sqlite_db, "job-1", None)
+    assert database.get_next_tailored_version("job-1") == 3
+
+
+def test_versions_are_numbered_per_job(sqlite_db):
+    _insert(sqlite_db, "job-1", 1)
+    _insert(sqlite_db, "job-1", 2)
+    _insert(sqlite_db, "job-2", 1)
+
+    assert database.get_next_tailored_version("job-1") == 3
+    assert database.get_next_tailored_version("job-2") == 2
+    assert database.get_next_tailored_version("job-3") == 1